@@ -1,5 +1,14 @@
 from __future__ import annotations
+import sys
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+import lazy_registry
+from lazy_registry import LazyRegistry
+
 
 
 class AbstractFactory(ABC):
@@ -10,6 +19,20 @@ class AbstractFactory(ABC):
     제품군은 여러 가지 변형을 가질 수 있지만, 한 변형의 제품은 다른 변형의 제품과 호환되지 않습니다.
     """
 
+    _registry = LazyRegistry()
+
+    def __init_subclass__(cls, key: Optional[str] = None, **kwargs) -> None:
+        """
+        키를 지정한 구체적인 팩토리는 레지스트리에 등록되어 `AbstractFactory.for_key`로 찾을 수 있습니다.
+        """
+        super().__init_subclass__(**kwargs)
+        if key is not None:
+            AbstractFactory._registry.register(key, cls)
+
+    @staticmethod
+    def for_key(key: str) -> AbstractFactory:
+        return AbstractFactory._registry.lookup(key)()
+
     @abstractmethod
     def create_product_a(self) -> AbstractProductA:
         pass
@@ -18,9 +41,28 @@ class AbstractFactory(ABC):
     def craete_product_b(self) -> AbstractProductB:
         pass
 
+    def create_families(self, count: int) -> List[Tuple[AbstractProductA, AbstractProductB]]:
+        """
+        서로 호환되는 (제품 A, 제품 B) 쌍을 `count`개 만들어 반환합니다.
+
+        첫 번째 쌍은 팩토리 메서드로 만들고 변형이 일치하는지 한 번만 확인합니다.
+        나머지 쌍은 확인된 구체적인 제품 클래스를 직접 인스턴스화합니다. 따라서 팩토리 메서드가
+        호출마다 다른 클래스를 돌려주거나 생성자에 인수가 필요한 팩토리는 이 메서드를 재정의해야 합니다.
+        """
+        if count <= 0:
+            return []
+        product_a = self.create_product_a()
+        product_b = self.craete_product_b()
+        check_variant(product_a, product_b)
+
+        product_a_class, product_b_class = type(product_a), type(product_b)
+        families = [(product_a, product_b)]
+        families += [(product_a_class(), product_b_class()) for _ in range(count - 1)]
+        return families
+
 
 
-class ConcreteFactory1(AbstractFactory):
+class ConcreteFactory1(AbstractFactory, key="factory1"):
     """
     구체적인 팩토리는 단일 변형에 속하는 제품군을 생성합니다.
     팩토리는 생성된 제품이 서로 호환된다는 것을 보장합니다.
@@ -36,7 +78,7 @@ class ConcreteFactory1(AbstractFactory):
 
 
 
-class ConcreteFactory2(AbstractFactory):
+class ConcreteFactory2(AbstractFactory, key="factory2"):
     """
     각 구체적인 팩토리는 해당하는 제품 변형을 가지고 있습니다.
     """
@@ -55,6 +97,11 @@ class AbstractProductA(ABC):
     제품의 모든 변형은 이 인터페이를 구현해야 합니다.
     """
 
+    variant: Optional[str] = None
+    """
+    제품이 속한 변형입니다. 같은 변형의 제품끼리만 호환됩니다.
+    """
+
     @abstractmethod
     def useful_function_a(self) -> str:
         pass
@@ -67,12 +114,16 @@ class AbstractProductA(ABC):
 
 
 class ConcreteProductA1(AbstractProductA):
+    variant = "1"
+
     def useful_function_a(self) -> str:
         return "제품 A1의 결과입니다."
 
 
 
 class ConcreteProductA2(AbstractProductA):
+    variant = "2"
+
     def useful_function_a(self) -> str:
         return "제품 A2의 결과입니다."
 
@@ -85,6 +136,8 @@ class AbstractProductB(ABC):
     동일한 구체적인 변형의 제품끼리만 올바르게 상호작용할 수 있습니다.
     """
 
+    variant: Optional[str] = None
+
     @abstractmethod
     def useful_function_b(self) -> str:
         """
@@ -107,6 +160,8 @@ class AbstractProductB(ABC):
 
 
 class ConcreteProductB1(AbstractProductB):
+    variant = "1"
+
     def useful_function_b(self) -> str:
         return "제품 B1의 결과입니다."
     
@@ -121,6 +176,8 @@ class ConcreteProductB1(AbstractProductB):
 
 
 class ConcreteProductB2(AbstractProductB):
+    variant = "2"
+
     def useful_function_b(self) -> str:
         return "제품 B2의 결과입니다."
     
@@ -134,6 +191,92 @@ class ConcreteProductB2(AbstractProductB):
 
 
 
+class CollaborationCache:
+    """
+    제품 B와 제품 A의 협력 결과를 보관하는 크기 제한 LRU 캐시입니다.
+
+    키는 (제품 B 클래스, 제품 A 클래스, 제품 A의 변형)입니다. 따라서 협력 결과가 두 제품의
+    구체적인 유형만으로 결정되는 경우에만 사용해야 합니다. 제품의 동작이 바뀌었다면 `invalidate`로
+    해당 변형이나 전체 캐시를 비웁니다.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize는 1 이상이어야 합니다.")
+        self._maxsize = maxsize
+        self._results: "OrderedDict[Tuple[type, type, Optional[str]], str]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def collaborate(self, product_b: AbstractProductB, collaborator: AbstractProductA) -> str:
+        key = (type(product_b), type(collaborator), collaborator.variant)
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        result = product_b.another_useful_function_b(collaborator)
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+        return result
+
+    def invalidate(self, variant: Optional[str] = None) -> None:
+        """
+        주어진 변형의 결과를, 변형을 생략하면 모든 결과를 지웁니다.
+        """
+        with self._lock:
+            if variant is None:
+                self._results.clear()
+                return
+            for key in [key for key in self._results if key[2] == variant]:
+                del self._results[key]
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._results), "hit_ratio": self.hit_ratio}
+
+
+
+class MemoizedProductB(AbstractProductB):
+    """
+    어떤 AbstractProductB 구현이든 감싸서 협력 결과를 캐시에서 재사용하게 하는 데코레이터입니다.
+    """
+
+    def __init__(self, wrapped: AbstractProductB, cache: CollaborationCache) -> None:
+        self._wrapped = wrapped
+        self._cache = cache
+        self.variant = wrapped.variant
+
+    def useful_function_b(self) -> str:
+        return self._wrapped.useful_function_b()
+
+    def another_useful_function_b(self, collaborator: AbstractProductA) -> str:
+        return self._cache.collaborate(self._wrapped, collaborator)
+
+
+
+def check_variant(product_a: AbstractProductA, product_b: AbstractProductB) -> None:
+    """
+    두 제품이 같은 변형에 속하는지 확인합니다.
+    """
+    if product_a.variant != product_b.variant:
+        raise TypeError(
+            f"{type(product_a).__name__}(변형 {product_a.variant})와 "
+            f"{type(product_b).__name__}(변형 {product_b.variant})는 호환되지 않습니다."
+        )
+
+
+
 def client_code(factory: AbstractFactory) -> None:
     """
     클라이언트 코드는 팩토리 및 제품을 추상 타입인 AbstractFactory와 AbstractProduct를 통해서만 작업합니다.
@@ -146,6 +289,49 @@ def client_code(factory: AbstractFactory) -> None:
     print(f"{product_b.another_useful_function_b(product_a)}", end="")
 
 
+def benchmark_families(count: int = 200_000) -> Dict[str, float]:
+    """
+    쌍마다 팩토리 메서드를 호출하고 변형을 확인하는 반복문과 `create_families`의 초당 쌍 수를 비교합니다.
+    """
+    factory = ConcreteFactory1()
+    results = {}
+
+    start = time.perf_counter()
+    families = []
+    for _ in range(count):
+        product_a = factory.create_product_a()
+        product_b = factory.craete_product_b()
+        check_variant(product_a, product_b)
+        families.append((product_a, product_b))
+    results["per_call"] = count / (time.perf_counter() - start)
+    del families
+
+    start = time.perf_counter()
+    factory.create_families(count)
+    results["create_families"] = count / (time.perf_counter() - start)
+    return results
+
+
+
+def benchmark_startup(modules: int = 300) -> Dict[str, Any]:
+    """
+    팩토리 모듈 `modules`개를 모두 미리 임포트할 때와 경로만 등록한 뒤 하나만 사용할 때의 시작 시간을 비교합니다.
+    """
+    return lazy_registry.benchmark_startup(
+        "abstract_factory", "AbstractFactory._registry", "abstract_factory.AbstractFactory.for_key('plugin0')",
+        lambda index: (
+            "from abstract_factory import AbstractFactory, ConcreteProductA1, ConcreteProductB1\n\n"
+            f"class Plugin{index}(AbstractFactory, key='plugin{index}'):\n"
+            "    def create_product_a(self):\n"
+            "        return ConcreteProductA1()\n\n"
+            "    def craete_product_b(self):\n"
+            "        return ConcreteProductB1()\n"
+        ),
+        modules,
+    )
+
+
+
 if __name__ == "__main__":
     """
     클라이언트 코드는 어떤 구체적인 팩토리 클래스와도 작업할 수 있습니다
@@ -158,4 +344,48 @@ if __name__ == "__main__":
     print("클라이언트: 동일한 클라이언트 코드를 두 번째 팩토리 유형으로 테스트 중:")
     client_code(ConcreteFactory2())
 
+    print("\n")
+
+    # 팩토리는 키로도 찾을 수 있습니다. 경로로만 등록된 팩토리는 처음 요청될 때 임포트됩니다.
+    print("클라이언트: 키 'factory1'로 찾은 팩토리로 클라이언트 코드를 테스트 중:")
+    client_code(AbstractFactory.for_key("factory1"))
+
+    print("\n")
+
+    # 경로로 등록한 팩토리는 처음 요청될 때 모듈을 임포트하며, 걸린 시간이 보고서에 기록됩니다.
+    # 플러그인 모듈은 `abstract_factory`를 임포트하므로, 스크립트로 실행할 때 이 파일이 다시 임포트되어
+    # 별도의 레지스트리가 생기지 않도록 지금 모듈을 그 이름으로 등록해 둡니다.
+    sys.modules.setdefault("abstract_factory", sys.modules[__name__])
+    AbstractFactory._registry.register_path("factory3", "abstract_factory_plugin:ConcreteFactory3")
+    print(f"클라이언트: 아직 임포트하지 않은 팩토리 {AbstractFactory._registry.report()['deferred']}")
+    client_code(AbstractFactory.for_key("factory3"))
+    loaded = AbstractFactory._registry.report()["loaded"]
+    print(f"\n클라이언트: 지연 임포트한 팩토리 {list(loaded)}, {sum(loaded.values()):.4f}초")
+
+    print("\n")
+
+    # 팩토리는 호환되는 제품 쌍을 한 번에 여러 개 만들 수 있습니다.
+    families = ConcreteFactory2().create_families(3)
+    print(f"클라이언트: 두 번째 팩토리로 제품 쌍 {len(families)}개를 한 번에 만들었습니다:")
+    print(families[-1][1].another_useful_function_b(families[-1][0]), end="")
+
+    print("\n")
+
+    # 협력 결과를 캐시하면 같은 변형의 협력자에 대해 결과를 다시 계산하지 않습니다.
+    cache = CollaborationCache(maxsize=16)
+    memoized_b = MemoizedProductB(ConcreteFactory1().craete_product_b(), cache)
+    for _ in range(3):
+        memoized_b.another_useful_function_b(ConcreteFactory1().create_product_a())
+    print(f"클라이언트: 협력 결과 캐시 통계 {cache.stats()}", end="")
+
+    if "--bench" in sys.argv[1:]:
+        print("\n")
+        for name, rate in benchmark_families().items():
+            print(f"{name}: 초당 {rate:,.0f}쌍")
+        startup = benchmark_startup()
+        print(
+            f"시작 시간: 모두 임포트 {startup['eager_seconds']:.3f}초, 지연 임포트 {startup['lazy_seconds']:.3f}초 "
+            f"(임포트를 생략한 모듈 {startup['deferred_modules']}개, {startup['saved_seconds']:.3f}초 절약)"
+        )
+
 # python creational_pattern/abstract_factory.py
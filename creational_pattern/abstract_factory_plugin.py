@@ -0,0 +1,36 @@
+from abstract_factory import AbstractFactory, AbstractProductA, AbstractProductB
+
+
+
+"""
+세 번째 변형의 팩토리와 제품입니다. abstract_factory.py는 이 모듈을 경로로만 등록해 두므로,
+키 'factory3'가 처음 요청될 때에야 임포트됩니다.
+"""
+
+
+class ConcreteFactory3(AbstractFactory, key="factory3"):
+    def create_product_a(self) -> AbstractProductA:
+        return ConcreteProductA3()
+
+    def craete_product_b(self) -> AbstractProductB:
+        return ConcreteProductB3()
+
+
+
+class ConcreteProductA3(AbstractProductA):
+    variant = "3"
+
+    def useful_function_a(self) -> str:
+        return "제품 A3의 결과입니다."
+
+
+
+class ConcreteProductB3(AbstractProductB):
+    variant = "3"
+
+    def useful_function_b(self) -> str:
+        return "제품 B3의 결과입니다."
+
+    def another_useful_function_b(self, collaborator: AbstractProductA) -> str:
+        result = collaborator.useful_function_a()
+        return f"B3가 ({result})와 협력한 결과입니다."
@@ -0,0 +1,169 @@
+import json
+import sys
+import time
+import tracemalloc
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+
+
+class ClassAllocations:
+    """
+    구체적인 클래스 하나에 대해 생성된 인스턴스 수, 할당 바이트, 생성 지연 시간 히스토그램을 기록합니다.
+    """
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.instances = 0
+        self.bytes = 0
+        self.total_seconds = 0.0
+        self.histogram: List[int] = [0] * (len(bounds) + 1)
+
+    def record(self, bucket: int, seconds: float, size: int) -> None:
+        self.instances += 1
+        self.bytes += size
+        self.total_seconds += seconds
+        self.histogram[bucket] += 1
+
+
+
+class AllocationProfiler:
+    """
+    생성 패턴의 구체적인 클래스가 얼마나 많은 객체를 만들고 메모리를 할당하는지 기록하는 선택적 계측 도구입니다.
+
+    `instrument`로 지정한 클래스의 `__init__`을 감싸서, 실제로 인스턴스가 초기화될 때마다
+    지연 시간과 tracemalloc으로 잰 할당 바이트 수를 클래스별로 모읍니다. 싱글톤처럼 캐시된 인스턴스를
+    돌려주는 경우에는 `__init__`이 실행되지 않으므로 집계되지 않습니다.
+
+    할당 바이트는 인스턴스 자신의 크기에 `__init__` 동안 늘어난 추적 메모리를 더한 값입니다.
+    `__init__` 안에서 다른 객체를 만들면 그 크기도 포함되며, 다른 스레드의 할당이 섞일 수 있습니다.
+    CPython이 프리 리스트에서 재사용한 객체(빈 리스트 등)는 tracemalloc에 보이지 않으므로 근사치입니다.
+    """
+
+    DEFAULT_BOUNDS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2)
+    """
+    지연 시간 히스토그램의 구간 상한(초)입니다. 마지막 구간은 가장 큰 상한을 넘는 경우입니다.
+    """
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS) -> None:
+        self._bounds = tuple(bounds)
+        self._stats: Dict[type, ClassAllocations] = {}
+        self._originals: Dict[type, Optional[Callable]] = {}
+        self._started_tracing = False
+
+    def instrument(self, *classes: type) -> "AllocationProfiler":
+        for cls in classes:
+            if cls in self._originals:
+                continue
+            self._originals[cls] = cls.__dict__.get("__init__")
+            self._stats[cls] = ClassAllocations(self._bounds)
+            cls.__init__ = self._wrap(cls, cls.__init__)
+        return self
+
+    def _wrap(self, cls: type, init: Callable) -> Callable:
+        stats = self._stats[cls]
+        bounds = self._bounds
+
+        def __init__(instance, *args, **kwargs):
+            # 하위 클래스의 인스턴스는 그 클래스 자신의 래퍼가 기록합니다.
+            if type(instance) is not cls:
+                return init(instance, *args, **kwargs)
+            start = time.perf_counter()
+            before = tracemalloc.get_traced_memory()[0]
+            try:
+                return init(instance, *args, **kwargs)
+            finally:
+                grown = tracemalloc.get_traced_memory()[0] - before
+                seconds = time.perf_counter() - start
+                stats.record(bisect_left(bounds, seconds), seconds, sys.getsizeof(instance) + max(grown, 0))
+
+        __init__.__wrapped__ = init
+        return __init__
+
+    def uninstrument(self) -> None:
+        for cls, original in self._originals.items():
+            if original is None:
+                del cls.__init__
+            else:
+                cls.__init__ = original
+        self._originals.clear()
+
+    def __enter__(self) -> "AllocationProfiler":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.uninstrument()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _labels(self) -> List[str]:
+        labels = [f"<={bound:g}s" for bound in self._bounds]
+        labels.append(f">{self._bounds[-1]:g}s")
+        return labels
+
+    def report(self) -> Dict[str, Any]:
+        """
+        클래스별 집계를 JSON으로 직렬화할 수 있는 사전으로 반환합니다. 할당 바이트가 큰 순서로 정렬됩니다.
+        """
+        labels = self._labels()
+        classes = {}
+        for cls, stats in sorted(self._stats.items(), key=lambda item: -item[1].bytes):
+            classes[f"{cls.__module__}.{cls.__qualname__}"] = {
+                "instances": stats.instances,
+                "bytes": stats.bytes,
+                "mean_latency_seconds": stats.total_seconds / stats.instances if stats.instances else 0.0,
+                "latency_histogram": dict(zip(labels, stats.histogram)),
+            }
+        return {"classes": classes}
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.report(), ensure_ascii=False, **kwargs)
+
+
+
+def profile(workload: Callable[[], None], classes: Iterable[type]) -> Dict[str, Any]:
+    """
+    주어진 클래스들을 계측한 상태로 작업을 실행하고 보고서를 반환합니다.
+    """
+    with AllocationProfiler().instrument(*classes) as profiler:
+        workload()
+    return profiler.report()
+
+
+
+if __name__ == "__main__":
+    # 클라이언트 코드: 같은 디렉터리의 생성 패턴 예제를 부하 아래에서 계측합니다.
+    from abstract_factory import (
+        ConcreteFactory1, ConcreteFactory2, ConcreteProductA1, ConcreteProductA2,
+        ConcreteProductB1, ConcreteProductB2,
+    )
+    from builder import ConcreteBuilder1, Director, Product1
+    from factory_method import ConcreteCreator1, ConcreteCreator2, ConcreteProduct1, ConcreteProduct2
+    from thread_safe_singleton import Singleton
+
+    def workload() -> None:
+        director = Director()
+        for _ in range(10_000):
+            for factory in (ConcreteFactory1(), ConcreteFactory2()):
+                factory.create_product_a()
+                factory.craete_product_b()
+            director.builder = ConcreteBuilder1()
+            director.builder_full_featured_product()
+            director.builder.product
+            ConcreteCreator1().some_operation()
+            ConcreteCreator2().some_operation()
+            Singleton("profiled")
+
+    report = profile(workload, [
+        ConcreteFactory1, ConcreteFactory2,
+        ConcreteProductA1, ConcreteProductA2, ConcreteProductB1, ConcreteProductB2,
+        ConcreteBuilder1, Product1,
+        ConcreteCreator1, ConcreteCreator2, ConcreteProduct1, ConcreteProduct2,
+        Singleton,
+    ])
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+# python creational_pattern/allocation_profiler.py
@@ -0,0 +1,127 @@
+import asyncio
+import time
+from typing import Any, Dict, List
+
+
+
+class AsyncSingletonMeta(type):
+    """
+    비동기 초기화를 지원하는 싱글톤 구현입니다.
+
+    인스턴스는 `await Cls.get_instance()`로 얻습니다. 여러 코루틴이 동시에 처음 요청하더라도
+    생성과 초기화는 한 번만 실행되고, 나머지 코루틴은 같은 작업의 결과를 기다립니다(single-flight).
+    `warm_up=True`로 선언한 클래스는 `prewarm()`으로 애플리케이션 시작 시 병렬로 미리 만들 수 있습니다.
+    """
+
+    _instances: Dict[type, Any] = {}
+
+    _pending: Dict[type, "asyncio.Task"] = {}
+    """
+    생성 중인 싱글톤의 작업입니다. 같은 클래스를 요청하는 코루틴은 이 작업을 함께 기다립니다.
+    """
+
+    _warm_up: List[type] = []
+
+    def __init__(cls, name, bases, namespace, warm_up: bool = False, **kwargs) -> None:
+        super().__init__(name, bases, namespace, **kwargs)
+        if warm_up:
+            AsyncSingletonMeta._warm_up.append(cls)
+
+    def __new__(mcs, name, bases, namespace, warm_up: bool = False, **kwargs):
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __call__(cls, *args, **kwargs):
+        """
+        이미 초기화된 인스턴스는 동기적으로도 얻을 수 있습니다.
+        """
+        if cls not in cls._instances:
+            raise RuntimeError(f"{cls.__name__}는 아직 초기화되지 않았습니다. `await {cls.__name__}.get_instance()`를 사용하세요.")
+        return cls._instances[cls]
+
+    async def get_instance(cls, *args, **kwargs):
+        """
+        `__init__` 인수의 값 변경은 반환된 인스턴스에 영향을 미치지 않습니다.
+        """
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+
+        task = cls._pending.get(cls)
+        if task is None:
+            task = asyncio.ensure_future(cls._create(*args, **kwargs))
+            cls._pending[cls] = task
+        # 기다리던 코루틴 하나가 취소되어도 공유된 생성 작업은 취소되지 않게 합니다.
+        return await asyncio.shield(task)
+
+    async def _create(cls, *args, **kwargs):
+        try:
+            instance = type.__call__(cls, *args, **kwargs)
+            await instance.initialize()
+            cls._instances[cls] = instance
+            return instance
+        finally:
+            # 실패한 경우에도 기록을 지워 다음 요청이 다시 시도할 수 있게 합니다.
+            cls._pending.pop(cls, None)
+
+
+
+class AsyncSingleton(metaclass=AsyncSingletonMeta):
+    """
+    비동기 싱글톤의 기본 클래스입니다. 하위 클래스는 `initialize`에서 연결 수립이나
+    캐시 적재처럼 시간이 걸리는 준비 작업(워밍업 훅)을 수행합니다.
+    """
+
+    async def initialize(self) -> None:
+        pass
+
+
+
+async def prewarm(*classes: type) -> List[Any]:
+    """
+    주어진 싱글톤들, 또는 `warm_up=True`로 등록된 모든 싱글톤을 병렬로 초기화합니다.
+    """
+    targets = classes or tuple(AsyncSingletonMeta._warm_up)
+    return await asyncio.gather(*(cls.get_instance() for cls in targets))
+
+
+
+class Database(AsyncSingleton, warm_up=True):
+    async def initialize(self) -> None:
+        await asyncio.sleep(0.2)
+
+
+
+class Cache(AsyncSingleton, warm_up=True):
+    async def initialize(self) -> None:
+        await asyncio.sleep(0.2)
+
+
+
+class Session(AsyncSingleton):
+    constructions = 0
+
+    async def initialize(self) -> None:
+        Session.constructions += 1
+        await asyncio.sleep(0.2)
+
+
+
+async def main() -> None:
+    start = time.perf_counter()
+    await prewarm()
+    print(f"두 싱글톤을 병렬로 워밍업하는 데 {time.perf_counter() - start:.2f}초가 걸렸습니다.")
+
+    # 아직 없는 싱글톤을 10개의 코루틴이 동시에 요청합니다.
+    instances = await asyncio.gather(*(Session.get_instance() for _ in range(10)))
+    if all(instance is instances[0] for instance in instances) and Session() is instances[0]:
+        print(f"싱글톤이 작동합니다. 10개의 코루틴이 같은 인스턴스를 받았고 생성은 {Session.constructions}번 실행되었습니다.")
+    else:
+        print("싱글톤이 실패했습니다. 코루틴들이 다른 인스턴스를 받았습니다.")
+
+
+
+if __name__ == "__main__":
+    # 클라이언트 코드
+    asyncio.run(main())
+
+# python creational_pattern/async_singleton.py
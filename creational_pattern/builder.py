@@ -1,6 +1,9 @@
 from __future__ import annotations
+import gc
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 
 
@@ -26,6 +29,21 @@ class Builder(ABC):
     def produce_part_c(self) -> None:
         pass
 
+    def produce_batch(self, recipe: Sequence[str], count: int) -> List[Any]:
+        """
+        같은 레시피(빌딩 단계 이름의 순서)로 제품 `count`개를 만들어 반환합니다.
+
+        기본 구현은 제품마다 각 단계를 호출합니다. 여러 제품의 부분을 한 번에 채울 수 있는
+        Builder는 이 메서드를 재정의하여 단계별 호출 비용을 묶음 단위로 줄일 수 있습니다.
+        """
+        steps = [getattr(self, step) for step in recipe]
+        products = []
+        for _ in range(count):
+            for step in steps:
+                step()
+            products.append(self.product)
+        return products
+
 
 
 class ConcreteBuilder1(Builder):
@@ -34,14 +52,19 @@ class ConcreteBuilder1(Builder):
     프로그램은 여러 변형의 Builder를 가질 수 있으며, 각각 다르게 구현될 수 있습니다.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, pool: Optional[ProductPool] = None) -> None:
         """
         새로운 빌더 인스턴스는 이후 조립에 사용될 빈 제품 객체를 포함해야 합니다.
+        `pool`을 전달하면 새 제품을 할당하는 대신 풀에 반납된 제품을 재사용합니다.
         """
+        self._pool = pool
         self.reset()
 
     def reset(self) -> None:
-        self._product = Product1()
+        if self._pool is not None:
+            self._product = self._pool.acquire()
+        else:
+            self._product = Product1()
 
     @property
     def product(self) -> Product1:
@@ -68,6 +91,41 @@ class ConcreteBuilder1(Builder):
     def produce_part_c(self) -> None:
         self._product.add("PartC1")
 
+    _PARTS = {
+        "produce_part_a": "PartA1",
+        "produce_part_b": "PartB1",
+        "produce_part_c": "PartC1",
+    }
+
+    def produce_batch(self, recipe: Sequence[str], count: int) -> List[Product1]:
+        """
+        레시피를 부분 목록으로 한 번만 해석한 뒤, 모든 제품에 그 목록을 한꺼번에 채웁니다.
+        하위 클래스가 단계나 `reset`을 재정의했다면 `_PARTS`가 그 동작을 모르므로 기본 구현으로 단계를 하나씩 호출합니다.
+        """
+        if not self._uses_own_steps(recipe):
+            return super().produce_batch(recipe, count)
+        if count <= 0:
+            return []
+        parts = [self._PARTS[step] for step in recipe]
+        # 현재 조립 중인 제품이 첫 번째 제품이 됩니다. 기존 단계별 호출과 같은 결과를 유지합니다.
+        products = [self._product]
+        acquire = self._pool.acquire if self._pool is not None else Product1
+        for _ in range(count - 1):
+            products.append(acquire())
+        for product in products:
+            product.parts.extend(parts)
+        self.reset()
+        return products
+
+    def _uses_own_steps(self, recipe: Sequence[str]) -> bool:
+        cls = type(self)
+        if cls.reset is not ConcreteBuilder1.reset:
+            return False
+        for step in recipe:
+            if step not in self._PARTS or getattr(cls, step) is not getattr(ConcreteBuilder1, step):
+                return False
+        return True
+
 
 
 class Product1():
@@ -85,7 +143,184 @@ class Product1():
         self.parts.append(part)
 
     def list_parts(self) -> None:
-        print(f"제품의 부분들: {', '.join(self.parts)}", end="")
+        # 부분이 아주 많아도 하나의 큰 문자열을 만들지 않도록 하나씩 출력합니다.
+        write = sys.stdout.write
+        write("제품의 부분들: ")
+        for index, part in enumerate(self.parts):
+            if index:
+                write(", ")
+            write(part)
+
+    def clear(self) -> None:
+        """
+        부분 리스트 객체는 그대로 두고 내용만 비웁니다. 풀에서 재사용하기 전에 호출됩니다.
+        """
+        self.parts.clear()
+
+
+
+class ProductPool:
+    """
+    다 쓴 Product1을 반납받아 재사용하는 크기 제한 풀입니다.
+    제품을 새로 할당하는 대신 내용만 비워 다시 내주므로 할당과 GC 부담이 줄어듭니다.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        if capacity < 1:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+        self._capacity = capacity
+        self._free: List[Product1] = []
+        self._free_ids: Set[int] = set()
+        """
+        풀 안에 있는 제품들의 id입니다. 같은 제품을 두 번 반납하면 두 빌더가 하나의 제품을 나눠 갖게 되므로 이를 막습니다.
+        """
+        self.allocations = 0
+        self.reuses = 0
+
+    def acquire(self) -> Product1:
+        if self._free:
+            self.reuses += 1
+            product = self._free.pop()
+            self._free_ids.discard(id(product))
+            return product
+        self.allocations += 1
+        return Product1()
+
+    def release(self, product: Product1) -> None:
+        """
+        제품을 풀에 반납합니다. 반납한 뒤에는 클라이언트가 그 제품을 더 이상 사용하면 안 됩니다.
+        풀이 가득 차 있으면 제품은 그냥 버려집니다. 이미 풀에 있는 제품을 다시 반납하면 ValueError를 발생시킵니다.
+        """
+        if id(product) in self._free_ids:
+            raise ValueError("이미 풀에 반납된 제품입니다.")
+        if len(self._free) < self._capacity:
+            product.clear()
+            self._free.append(product)
+            self._free_ids.add(id(product))
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+
+
+class StreamingBuilder(Builder):
+    """
+    부분을 제품 안에 모아 두지 않고, 만들어지는 즉시 싱크로 내보내는 Builder입니다.
+
+    싱크는 문자열 하나를 받는 호출 가능 객체입니다. 예를 들어 파일의 `write`, 소켓 버퍼의 `write`,
+    준비된 제너레이터의 `send`를 그대로 전달할 수 있습니다. 제품이 부분을 보관하지 않으므로
+    부분이 수백만 개여도 메모리 사용량이 일정합니다.
+    """
+
+    def __init__(self, sink: Callable[[str], Any]) -> None:
+        self._sink = sink
+        self.reset()
+
+    def reset(self) -> None:
+        self._product = StreamingProduct(self._sink)
+
+    @property
+    def product(self) -> StreamingProduct:
+        product = self._product
+        self.reset()
+        return product
+
+    def produce_part_a(self) -> None:
+        self._product.add("PartA1")
+
+    def produce_part_b(self) -> None:
+        self._product.add("PartB1")
+
+    def produce_part_c(self) -> None:
+        self._product.add("PartC1")
+
+
+
+class StreamingProduct:
+    """
+    부분을 받는 즉시 `제품의 부분들: A, B, ...` 형식으로 싱크에 써 나가는 제품입니다.
+    보관하는 것은 지금까지 받은 부분의 개수뿐입니다.
+    """
+
+    def __init__(self, sink: Callable[[str], Any]) -> None:
+        self._sink = sink
+        self.count = 0
+
+    def add(self, part: Any) -> None:
+        self._sink(", " + part if self.count else "제품의 부분들: " + part)
+        self.count += 1
+
+    def list_parts(self) -> None:
+        """
+        부분들은 이미 싱크로 렌더링되었으므로, 부분이 하나도 없었을 때만 머리말을 씁니다.
+        """
+        if not self.count:
+            self._sink("제품의 부분들: ")
+
+
+
+class RecordingBuilder(Builder):
+    """
+    실제로 제품을 만들지 않고 호출된 빌딩 단계의 이름만 기록하는 Builder입니다.
+    Director의 메서드를 한 번 실행하여 레시피를 얻는 데 사용합니다.
+    """
+
+    def __init__(self) -> None:
+        self.steps: List[str] = []
+
+    @property
+    def product(self) -> None:
+        return None
+
+    def produce_part_a(self) -> None:
+        self.steps.append("produce_part_a")
+
+    def produce_part_b(self) -> None:
+        self.steps.append("produce_part_b")
+
+    def produce_part_c(self) -> None:
+        self.steps.append("produce_part_c")
+
+
+
+class CompiledRecipe:
+    """
+    특정 Builder 클래스에 맞게 미리 검증하고 컴파일한 레시피입니다.
+
+    단계마다 메서드를 찾는 대신, 단계 함수들을 순서대로 직접 호출하는 평평한 함수를 한 번 생성해 둡니다.
+    단계 함수는 컴파일할 때의 클래스에서 고정되므로, 하위 클래스 Builder에는 `for_class()`로 그 클래스용 레시피를 씁니다.
+    """
+
+    def __init__(self, recipe: Sequence[str], builder_class: type) -> None:
+        functions = []
+        for step in recipe:
+            function = getattr(builder_class, step, None)
+            if not step.startswith("produce_") or not callable(function):
+                raise ValueError(f"{builder_class.__name__}에는 빌딩 단계 {step!r}가 없습니다.")
+            functions.append(function)
+
+        self.steps: Tuple[str, ...] = tuple(recipe)
+        self.builder_class = builder_class
+        self._variants: Dict[type, CompiledRecipe] = {builder_class: self}
+
+        namespace = {f"step{index}": function for index, function in enumerate(functions)}
+        body = "".join(f"    step{index}(builder)\n" for index in range(len(functions))) or "    pass\n"
+        exec(f"def replay(builder):\n{body}", namespace)
+        self.replay: Callable[[Builder], None] = namespace["replay"]
+
+    def for_class(self, builder_class: type) -> CompiledRecipe:
+        """
+        같은 레시피를 `builder_class`용으로 컴파일한 결과를 돌려줍니다. 클래스마다 한 번만 컴파일합니다.
+        """
+        variant = self._variants.get(builder_class)
+        if variant is None:
+            if not issubclass(builder_class, self.builder_class):
+                raise TypeError(f"이 레시피는 {self.builder_class.__name__}용으로 컴파일되었습니다.")
+            variant = self._variants[builder_class] = CompiledRecipe(self.steps, builder_class)
+        return variant
+
+    def __call__(self, builder: Builder) -> None:
+        self.for_class(type(builder)).replay(builder)
 
 
 
@@ -125,6 +360,154 @@ class Director:
         self.builder.produce_part_b()
         self.builder.produce_part_c()
 
+    """
+    레시피는 Director의 제품 변형을 빌딩 단계 이름의 순서로 나타낸 것입니다.
+    """
+
+    MINIMAL_VIABLE_PRODUCT = ("produce_part_a",)
+
+    FULL_FEATURED_PRODUCT = ("produce_part_a", "produce_part_b", "produce_part_c")
+
+    def record(self, method: Callable[[], None]) -> Tuple[str, ...]:
+        """
+        `director.builder_full_featured_product`처럼 Director의 메서드를 한 번 실행하여 레시피로 기록합니다.
+        """
+        builder = self._builder
+        recorder = RecordingBuilder()
+        self._builder = recorder
+        try:
+            method()
+        finally:
+            self._builder = builder
+        return tuple(recorder.steps)
+
+    def compile(self, recipe: Sequence[str], builder_class: Optional[type] = None) -> CompiledRecipe:
+        """
+        레시피를 검증하고 Builder 클래스(기본값은 현재 Builder의 클래스)에 맞게 컴파일합니다.
+        """
+        if builder_class is None:
+            builder_class = type(self._builder)
+        return CompiledRecipe(recipe, builder_class)
+
+    def replay(self, compiled: CompiledRecipe) -> None:
+        """
+        컴파일된 레시피를 현재 Builder에 재생합니다. `builder` 속성을 거치지 않고 바로 단계 함수를 호출합니다.
+        현재 Builder가 하위 클래스라면 그 클래스용으로 다시 컴파일한 레시피를 써서 재정의된 단계를 따릅니다.
+        """
+        builder = self._builder
+        compiled.for_class(type(builder)).replay(builder)
+
+    def build_batch(self, recipe: Sequence[str], count: int) -> List[Any]:
+        """
+        하나의 레시피로 제품 `count`개를 한 번에 만듭니다.
+        """
+        return self.builder.produce_batch(recipe, count)
+
+    def build_each(self, recipes: Iterable[Sequence[str]]) -> List[Any]:
+        """
+        레시피마다 제품 하나씩을 순서대로 만듭니다. 연속된 같은 레시피는 한 묶음으로 처리합니다.
+        """
+        products: List[Any] = []
+        current: Optional[Sequence[str]] = None
+        count = 0
+        for recipe in recipes:
+            if recipe == current:
+                count += 1
+                continue
+            if count:
+                products.extend(self.build_batch(current, count))
+            current, count = recipe, 1
+        if count:
+            products.extend(self.build_batch(current, count))
+        return products
+
+
+def benchmark_pool(products: int = 200_000, batch: int = 1000) -> Dict[str, Dict[str, float]]:
+    """
+    풀 없이, 그리고 풀을 사용해 제품을 조립할 때의 할당 횟수와 GC 정지 시간을 비교합니다.
+    제품은 `batch`개씩 모아 두었다가 한꺼번에 버리거나 반납합니다.
+    """
+    constructions = [0]
+    original_init = Product1.__init__
+
+    def counting_init(product: Product1) -> None:
+        constructions[0] += 1
+        original_init(product)
+
+    results = {}
+    for name, pool in (("unpooled", None), ("pooled", ProductPool(capacity=batch))):
+        director = Director()
+        builder = ConcreteBuilder1(pool)
+        director.builder = builder
+
+        pauses: List[float] = []
+        started: List[float] = []
+
+        def on_gc(phase: str, info: Dict[str, int]) -> None:
+            if phase == "start":
+                started.append(time.perf_counter())
+            elif started:
+                pauses.append(time.perf_counter() - started.pop())
+
+        # 앞선 측정에서 남은 객체가 이번 측정의 GC 비용에 섞이지 않게 합니다.
+        gc.collect()
+        gc.callbacks.append(on_gc)
+        # 두 방식 모두 실제로 만들어진 Product1의 수를 셉니다.
+        constructions[0] = 0
+        Product1.__init__ = counting_init
+        start = time.perf_counter()
+        try:
+            for _ in range(products // batch):
+                finished = []
+                for _ in range(batch):
+                    director.builder_full_featured_product()
+                    finished.append(builder.product)
+                if pool is not None:
+                    for product in finished:
+                        pool.release(product)
+        finally:
+            elapsed = time.perf_counter() - start
+            Product1.__init__ = original_init
+            gc.callbacks.remove(on_gc)
+
+        results[name] = {
+            "allocations": constructions[0],
+            "seconds": elapsed,
+            "gc_collections": len(pauses),
+            "gc_pause_seconds": sum(pauses),
+        }
+    return results
+
+
+
+def benchmark_batch(products: int = 200_000) -> Dict[str, float]:
+    """
+    제품마다 Director 메서드를 호출하는 방식과 묶음 API의 초당 제품 수를 비교합니다.
+    """
+    director = Director()
+    director.builder = ConcreteBuilder1()
+    results = {}
+
+    start = time.perf_counter()
+    for _ in range(products):
+        director.builder_full_featured_product()
+        director.builder.product
+    results["per_product"] = products / (time.perf_counter() - start)
+
+    compiled = director.compile(director.record(director.builder_full_featured_product))
+    builder = director.builder
+    start = time.perf_counter()
+    for _ in range(products):
+        director.replay(compiled)
+        builder.product
+    results["compiled_replay"] = products / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    director.build_batch(Director.FULL_FEATURED_PRODUCT, products)
+    results["build_batch"] = products / (time.perf_counter() - start)
+    return results
+
+
 
 if __name__ == "__main__":
     """
@@ -154,4 +537,58 @@ if __name__ == "__main__":
     builder.produce_part_b()
     builder.product.list_parts()
 
+    print("\n")
+
+    # 풀을 사용하는 빌더는 반납된 제품을 비운 뒤 재사용합니다.
+    print("풀을 사용하는 제품: ")
+    pool = ProductPool(capacity=2)
+    director.builder = ConcreteBuilder1(pool)
+    for _ in range(3):
+        director.builder_full_featured_product()
+        product = director.builder.product
+        product.list_parts()
+        print()
+        pool.release(product)
+    print(f"새로 할당된 제품: {pool.allocations}개, 재사용된 제품: {pool.reuses}개", end="")
+
+    print("\n")
+
+    # Director는 여러 레시피의 제품을 한 번에 만들 수 있습니다.
+    print("묶음으로 조립한 제품: ")
+    director.builder = builder
+    for product in director.build_each([
+        Director.MINIMAL_VIABLE_PRODUCT,
+        Director.FULL_FEATURED_PRODUCT,
+        Director.FULL_FEATURED_PRODUCT,
+    ]):
+        product.list_parts()
+        print()
+
+    print()
+
+    # Director의 실행을 한 번 레시피로 기록하고 컴파일해 두면 이후에는 저렴하게 재생할 수 있습니다.
+    recipe = director.record(director.builder_full_featured_product)
+    print(f"기록된 레시피: {recipe}")
+    compiled = director.compile(recipe)
+    director.replay(compiled)
+    builder.product.list_parts()
+
+    print("\n")
+
+    # 스트리밍 빌더는 부분을 만들자마자 싱크로 내보냅니다. 여기서는 표준 출력이 싱크입니다.
+    print("스트리밍 제품: ")
+    director.builder = StreamingBuilder(sys.stdout.write)
+    director.builder_full_featured_product()
+    director.builder.product.list_parts()
+
+    if "--bench" in sys.argv[1:]:
+        print("\n")
+        for name, rate in benchmark_batch().items():
+            print(f"{name}: 초당 {rate:,.0f}개 제품")
+        for name, row in benchmark_pool().items():
+            print(
+                f"{name}: 할당 {row['allocations']:,}회, {row['seconds']:.3f}초, "
+                f"GC {row['gc_collections']}회/{row['gc_pause_seconds'] * 1000:.2f}ms"
+            )
+
 # python creational_pattern/builder.py
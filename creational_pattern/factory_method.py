@@ -1,5 +1,15 @@
 from __future__ import annotations
+import random
+import sys
+import time
+import types
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock, local
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import lazy_registry
+from lazy_registry import LazyRegistry
 
 
 class Creator(ABC):
@@ -8,6 +18,29 @@ class Creator(ABC):
     Creator의 하위 클래스는 보통 이 메서드의 구현을 제공합니다.
     """
 
+    product_cache: Optional[ProductCache] = None
+    """
+    하위 클래스는 이 속성에 캐시를 지정하여 팩토리 메서드가 만든 제품을 재사용하도록 선택할 수 있습니다.
+    제품이 상태를 갖지 않을 때만 사용해야 합니다.
+    """
+
+    _registry = LazyRegistry()
+
+    def __init_subclass__(cls, key: Optional[str] = None, **kwargs) -> None:
+        """
+        `class ConcreteCreator1(Creator, key="creator1")`처럼 키를 지정한 하위 클래스는 레지스트리에 등록됩니다.
+        """
+        super().__init_subclass__(**kwargs)
+        if key is not None:
+            Creator._registry.register(key, cls)
+
+    @staticmethod
+    def for_key(key: str) -> Creator:
+        """
+        등록된 키로 구체적인 Creator의 인스턴스를 만듭니다.
+        """
+        return Creator._registry.lookup(key)()
+
     @abstractmethod
     def factory_method(self):
         """
@@ -15,6 +48,16 @@ class Creator(ABC):
         """
         pass
 
+    def get_product(self, *args: Hashable) -> Product:
+        """
+        `product_cache`가 지정되어 있으면 캐시된 제품을, 아니면 새 제품을 반환합니다.
+        인수는 팩토리 메서드에 그대로 전달되며 캐시의 키로도 사용됩니다.
+        """
+        cache = self.product_cache
+        if cache is None:
+            return self.factory_method(*args)
+        return cache.get((type(self), args), lambda: self.factory_method(*args))
+
     def some_operation(self) -> str:
         """
         Creator의 주된 책임은 제품을 생성하는 것이 아니라는 점을 유의하세요.
@@ -24,7 +67,7 @@ class Creator(ABC):
         """
 
         # 팩토리 메서드를 호출하여 Product 객체를 생성합니다.
-        product = self.factory_method()
+        product = self.get_product()
 
         # 이제 product를 사용합니다.
         result = f"Creator: 동일한 Creator의 코드가 {product.operation()}와/과 함께 작동했습니다."
@@ -37,7 +80,7 @@ class Creator(ABC):
 구체적인 Creator 클래스는 팩토리 메서드를 재정의하여 결과로 나오는 제품의 유형을 변경합니다.
 """
 
-class ConcreteCreator1(Creator):
+class ConcreteCreator1(Creator, key="creator1"):
     """
     메서드의 서명이 여전히 추상 제품 유형을 사용하고 있지만,
     실제로는 구체적인 제품이 메서드에서 반환됩니다.
@@ -48,7 +91,7 @@ class ConcreteCreator1(Creator):
         return ConcreteProduct1()
     
 
-class ConcreteCreator2(Creator):
+class ConcreteCreator2(Creator, key="creator2"):
     def factory_method(self) -> Product:
         return ConcreteProduct2()
     
@@ -58,6 +101,16 @@ class Product(ABC):
     Product 인터페이스는 모든 구체적인 제품이 구현해야 하는 작업을 선언합니다.
     """
 
+    _registry = LazyRegistry()
+
+    def __init_subclass__(cls, key: Optional[str] = None, **kwargs) -> None:
+        """
+        `class ConcreteProduct1(Product, key="product1")`처럼 키를 지정한 하위 클래스는 레지스트리에 등록됩니다.
+        """
+        super().__init_subclass__(**kwargs)
+        if key is not None:
+            Product._registry.register(key, cls)
+
     @abstractmethod
     def operation(self) -> str:
         pass
@@ -68,16 +121,116 @@ class Product(ABC):
 구체적인 제품 클래스는 Product 인터페이스의 다양한 구현을 제공합니다.
 """
 
-class ConcreteProduct1(Product):
+class ConcreteProduct1(Product, key="product1"):
     def operation(self) -> str:
         return "{ConcreteProduct1의 결과}"
     
 
-class ConcreteProduct2(Product):
+class ConcreteProduct2(Product, key="product2"):
     def operation(self) -> str:
         return "{ConcreteProduct2의 결과}"
     
 
+def create(key: str) -> Product:
+    """
+    문자열 키로 제품을 만듭니다. 사전 조회 한 번이므로 등록된 제품 수와 관계없이 일정한 시간이 걸립니다.
+    """
+    return Product._registry.lookup(key)()
+
+
+
+class ProductCache(ABC):
+    """
+    Creator가 만든 제품을 재사용하는 캐시의 기본 클래스입니다.
+    `avoided`는 캐시 덕분에 생략된 제품 생성 횟수, `constructed`는 실제로 생성한 횟수입니다.
+    """
+
+    def __init__(self) -> None:
+        self.avoided = 0
+        self.constructed = 0
+
+    @abstractmethod
+    def get(self, key: Tuple[type, Tuple[Hashable, ...]], build: Callable[[], Product]) -> Product:
+        pass
+
+
+
+class SingletonProductCache(ProductCache):
+    """
+    Creator 클래스(와 팩토리 메서드 인수)마다 제품을 하나만 만들어 모든 스레드가 공유합니다.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._products: Dict[Any, Product] = {}
+        self._lock = Lock()
+
+    def get(self, key, build):
+        product = self._products.get(key)
+        if product is not None:
+            self.avoided += 1
+            return product
+        with self._lock:
+            product = self._products.get(key)
+            if product is None:
+                product = self._products[key] = build()
+                self.constructed += 1
+                return product
+        self.avoided += 1
+        return product
+
+
+
+class ThreadLocalProductCache(ProductCache):
+    """
+    스레드마다 제품을 하나씩 만들어 재사용합니다. 제품을 스레드 간에 공유하면 안 될 때 사용합니다.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._local = local()
+
+    def get(self, key, build):
+        products = self._local.__dict__
+        product = products.get(key)
+        if product is None:
+            product = products[key] = build()
+            self.constructed += 1
+        else:
+            self.avoided += 1
+        return product
+
+
+
+class BoundedProductCache(ProductCache):
+    """
+    최근에 사용한 `maxsize`개의 키에 대해서만 제품을 보관하는 LRU 캐시입니다.
+    팩토리 메서드 인수의 종류가 많을 때 메모리를 제한하는 데 사용합니다.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize는 1 이상이어야 합니다.")
+        super().__init__()
+        self._maxsize = maxsize
+        self._products: "OrderedDict[Any, Product]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, build):
+        with self._lock:
+            product = self._products.get(key)
+            if product is not None:
+                self._products.move_to_end(key)
+                self.avoided += 1
+                return product
+            product = self._products[key] = build()
+            self.constructed += 1
+            if len(self._products) > self._maxsize:
+                self._products.popitem(last=False)
+            return product
+
+
+
 def client_code(creator: Creator) -> None:
     """
     클라이언트 코드는 구체적인 Creator의 인스턴스와 함께 작동하지만,
@@ -89,6 +242,71 @@ def client_code(creator: Creator) -> None:
           f"{creator.some_operation()}", end="")
     
 
+def benchmark_dispatch(types_count: int = 1_000, lookups: int = 200_000) -> Dict[str, float]:
+    """
+    제품 유형 `types_count`개를 등록하고, 레지스트리 조회와 if/elif 체인, 선형 탐색의 초당 생성 수를 비교합니다.
+    벤치마크용 제품은 애플리케이션의 레지스트리를 건드리지 않도록 별도의 레지스트리에 등록합니다.
+    """
+    registry = LazyRegistry()
+    classes = []
+    for index in range(types_count):
+        cls = types.new_class(
+            f"BenchProduct{index}", (Product,), {},
+            lambda namespace: namespace.update(operation=lambda self: "")
+        )
+        registry.register(f"bench{index}", cls)
+        classes.append(cls)
+
+    def create_with_registry(key: str) -> Product:
+        # `create`와 같은 방식으로 조회합니다.
+        return registry.lookup(key)()
+
+    # 비교 대상인 if/elif 체인을 실제 코드로 생성합니다.
+    source = ["def create_with_chain(key):"]
+    for index in range(types_count):
+        source.append(f"    {'if' if index == 0 else 'elif'} key == 'bench{index}':")
+        source.append(f"        return classes[{index}]()")
+    namespace = {"classes": classes}
+    exec("\n".join(source), namespace)
+    create_with_chain = namespace["create_with_chain"]
+
+    pairs = [(f"bench{index}", cls) for index, cls in enumerate(classes)]
+
+    def create_with_scan(key: str) -> Product:
+        for registered_key, cls in pairs:
+            if registered_key == key:
+                return cls()
+
+    rng = random.Random(0)
+    keys = [f"bench{rng.randrange(types_count)}" for _ in range(lookups)]
+    results = {}
+    for name, factory in (("registry", create_with_registry), ("if_elif", create_with_chain), ("linear_scan", create_with_scan)):
+        count = lookups if name == "registry" else lookups // 20
+        start = time.perf_counter()
+        for key in keys[:count]:
+            factory(key)
+        results[name] = count / (time.perf_counter() - start)
+    return results
+
+
+
+def benchmark_startup(modules: int = 300) -> Dict[str, Any]:
+    """
+    제품 모듈 `modules`개를 모두 미리 임포트할 때와 경로만 등록한 뒤 하나만 사용할 때의 시작 시간을 비교합니다.
+    """
+    return lazy_registry.benchmark_startup(
+        "factory_method", "Product._registry", "factory_method.create('plugin0')",
+        lambda index: (
+            "from factory_method import Product\n\n"
+            f"class Plugin{index}(Product, key='plugin{index}'):\n"
+            "    def operation(self) -> str:\n"
+            f"        return '{{Plugin{index}의 결과}}'\n"
+        ),
+        modules,
+    )
+
+
+
 if __name__=="__main__":
     print("App: ConcreteCreator1로 실행되었습니다.")
     client_code(ConcreteCreator1())
@@ -96,5 +314,31 @@ if __name__=="__main__":
 
     print("App: ConcreteCreator2로 실행되었습니다.")
     client_code(ConcreteCreator2())
+    print("\n")
+
+    # 캐시를 선언한 Creator는 상태가 없는 제품을 매번 새로 만들지 않습니다.
+    class CachedCreator1(ConcreteCreator1):
+        product_cache = SingletonProductCache()
+
+    for _ in range(3):
+        CachedCreator1().some_operation()
+    cache = CachedCreator1.product_cache
+    print(f"App: CachedCreator1은 제품을 {cache.constructed}번 생성하고 {cache.avoided}번 재사용했습니다.")
+    print()
+
+    # 등록된 키로 Creator나 제품을 직접 고를 수 있습니다.
+    print("App: 키 'creator2'로 실행되었습니다.")
+    client_code(Creator.for_key("creator2"))
+    print(f"\nApp: 키 'product1'로 만든 제품: {create('product1').operation()}", end="")
+
+    if "--bench" in sys.argv[1:]:
+        print("\n")
+        for name, rate in benchmark_dispatch().items():
+            print(f"{name}: 초당 {rate:,.0f}회 생성")
+        startup = benchmark_startup()
+        print(
+            f"시작 시간: 모두 임포트 {startup['eager_seconds']:.3f}초, 지연 임포트 {startup['lazy_seconds']:.3f}초 "
+            f"(임포트를 생략한 모듈 {startup['deferred_modules']}개, {startup['saved_seconds']:.3f}초 절약)"
+        )
 
 # python creational_pattern/factory_method.py
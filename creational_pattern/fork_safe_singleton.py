@@ -0,0 +1,137 @@
+import os
+from threading import Lock, Thread, local
+from typing import Any, Dict
+
+
+
+_HAS_AT_FORK = hasattr(os, "register_at_fork")
+
+
+
+class ForkSafeSingletonMeta(type):
+    """
+    프로세스 포크에 안전한 싱글톤 구현입니다.
+
+    `os.fork()`로 만들어진 자식 프로세스는 부모의 메모리를 그대로 물려받으므로, 보통의 싱글톤은
+    부모가 열어 둔 연결이나 잡고 있던 락까지 공유하게 됩니다. 이 메타클래스는 포크를 감지하면
+    레지스트리를 비워 자식 프로세스에서 인스턴스를 처음 요청할 때 새로 만들도록 합니다.
+
+    `scope="thread"`로 선언한 클래스는 프로세스가 아니라 스레드마다 하나의 인스턴스를 가집니다.
+    """
+
+    _instances: Dict[type, Any] = {}
+
+    _locks: Dict[type, Lock] = {}
+
+    _thread_instances = local()
+
+    _pid: int = os.getpid()
+    """
+    레지스트리를 채운 프로세스의 PID입니다. 포크 훅을 쓸 수 없는 플랫폼에서는 이 값으로 포크를 감지합니다.
+    """
+
+    def __new__(mcs, name, bases, namespace, scope: str = "process", **kwargs):
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __init__(cls, name, bases, namespace, scope: str = "process", **kwargs) -> None:
+        super().__init__(name, bases, namespace, **kwargs)
+        if scope not in ("process", "thread"):
+            raise ValueError(f"알 수 없는 scope입니다: {scope}")
+        cls._scope = scope
+        ForkSafeSingletonMeta._locks[cls] = Lock()
+
+    @classmethod
+    def _reset(mcs) -> None:
+        """
+        포크 직후 자식 프로세스에서 호출됩니다. 부모의 인스턴스를 버리고,
+        부모의 다른 스레드가 잡고 있었을 수도 있는 락을 새로 만듭니다.
+        """
+        mcs._instances = {}
+        mcs._locks = {cls: Lock() for cls in mcs._locks}
+        mcs._thread_instances = local()
+        mcs._pid = os.getpid()
+
+    def __call__(cls, *args, **kwargs):
+        """
+        `__init__` 인수의 값 변경은 반환된 인스턴스에 영향을 미치지 않습니다.
+        """
+        meta = ForkSafeSingletonMeta
+        if not _HAS_AT_FORK and meta._pid != os.getpid():
+            meta._reset()
+
+        if cls._scope == "thread":
+            # 스레드 로컬 저장소는 다른 스레드와 공유되지 않으므로 락이 필요 없습니다.
+            instances = meta._thread_instances.__dict__
+            if cls not in instances:
+                instances[cls] = super().__call__(*args, **kwargs)
+            return instances[cls]
+
+        instance = meta._instances.get(cls)
+        if instance is not None:
+            return instance
+
+        with meta._locks[cls]:
+            if cls not in meta._instances:
+                meta._instances[cls] = super().__call__(*args, **kwargs)
+        return meta._instances[cls]
+
+
+
+if _HAS_AT_FORK:
+    os.register_at_fork(after_in_child=ForkSafeSingletonMeta._reset)
+
+
+
+class Connection(metaclass=ForkSafeSingletonMeta):
+    """
+    프로세스마다 하나씩 있어야 하는 자원의 예입니다.
+    """
+
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+
+
+
+class RequestContext(metaclass=ForkSafeSingletonMeta, scope="thread"):
+    """
+    스레드마다 하나씩 있어야 하는 자원의 예입니다.
+    """
+
+
+
+if __name__ == "__main__":
+    # 클라이언트 코드
+
+    parent = Connection()
+    print(f"부모 프로세스 {os.getpid()}의 Connection은 PID {parent.pid}에서 만들어졌습니다.")
+
+    if hasattr(os, "fork"):
+        child_pid = os.fork()
+        if child_pid == 0:
+            child = Connection()
+            if child is not parent and child.pid == os.getpid():
+                print(f"자식 프로세스 {os.getpid()}는 자신의 Connection을 새로 만들었습니다.")
+            else:
+                print("자식 프로세스가 부모의 Connection을 물려받았습니다.")
+            os._exit(0)
+        os.waitpid(child_pid, 0)
+
+    contexts = {}
+
+    def remember(name: str) -> None:
+        contexts[name] = (RequestContext(), RequestContext())
+
+    workers = [Thread(target=remember, args=(name,)) for name in ("A", "B")]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    same_in_thread = all(first is second for first, second in contexts.values())
+    different_threads = contexts["A"][0] is not contexts["B"][0]
+    if same_in_thread and different_threads:
+        print("스레드 범위 싱글톤이 작동합니다. 스레드 안에서는 같고 스레드끼리는 다른 인스턴스입니다.")
+    else:
+        print("스레드 범위 싱글톤이 실패했습니다.")
+
+# python creational_pattern/fork_safe_singleton.py
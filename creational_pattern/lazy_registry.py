@@ -0,0 +1,132 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from threading import RLock
+from typing import Any, Callable, Dict, Set
+
+
+
+class LazyRegistry:
+    """
+    문자열 키로 클래스를 찾는 레지스트리입니다.
+
+    클래스를 직접 등록할 수도 있고, `"package.module:ClassName"` 형식의 경로만 등록해 둘 수도 있습니다.
+    경로로 등록한 클래스는 처음 요청될 때 모듈을 임포트하므로, 수백 개의 제품 모듈을 시작 시점에
+    모두 임포트할 필요가 없습니다. 지연 임포트에 걸린 시간은 `import_seconds`에 기록됩니다.
+
+    임포트 중인 모듈이 같은 레지스트리에서 다른 키를 요청할 수 있도록 락은 재진입 가능합니다.
+    """
+
+    def __init__(self) -> None:
+        self._classes: Dict[str, type] = {}
+        self._paths: Dict[str, str] = {}
+        self._lock = RLock()
+        self._loading: Set[str] = set()
+        self.import_seconds: Dict[str, float] = {}
+
+    def register(self, key: str, cls: type) -> None:
+        with self._lock:
+            path = self._paths.get(key)
+            if path is not None and (key in self._loading or path == f"{cls.__module__}:{cls.__qualname__}"):
+                # 경로로 등록된 클래스가 임포트되면서 스스로 등록하는 경우입니다.
+                # 패키지가 다시 내보낸 클래스는 정의된 모듈이 경로와 다르므로, 임포트 중인 키인지로 판단합니다.
+                del self._paths[key]
+            elif key in self._classes or path is not None:
+                raise ValueError(f"키 {key!r}는 이미 등록되어 있습니다.")
+            self._classes[key] = cls
+
+    def register_path(self, key: str, path: str) -> None:
+        if ":" not in path:
+            raise ValueError(f"경로는 'module:ClassName' 형식이어야 합니다: {path!r}")
+        with self._lock:
+            if key in self._classes or key in self._paths:
+                raise ValueError(f"키 {key!r}는 이미 등록되어 있습니다.")
+            self._paths[key] = path
+
+    def lookup(self, key: str) -> type:
+        cls = self._classes.get(key)
+        if cls is not None:
+            return cls
+        if key not in self._paths:
+            raise KeyError(f"등록되지 않은 키입니다: {key!r}")
+        return self._load(key)
+
+    def _load(self, key: str) -> type:
+        with self._lock:
+            path = self._paths.get(key)
+            if path is None:
+                # 락을 기다리는 동안 다른 스레드가 이미 임포트했습니다.
+                return self._classes[key]
+            module_name, _, attribute = path.partition(":")
+            start = time.perf_counter()
+            self._loading.add(key)
+            try:
+                cls = getattr(importlib.import_module(module_name), attribute)
+            finally:
+                self._loading.discard(key)
+            self.import_seconds[key] = time.perf_counter() - start
+            self._paths.pop(key, None)
+            self._classes.setdefault(key, cls)
+            return self._classes[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._classes or key in self._paths
+
+    def report(self) -> Dict[str, Any]:
+        """
+        지연 임포트 현황을 기계가 읽을 수 있는 형태로 반환합니다.
+        `deferred`는 아직 한 번도 요청되지 않아 임포트를 생략한 키들입니다.
+        """
+        return {
+            "loaded": dict(self.import_seconds),
+            "loaded_seconds": sum(self.import_seconds.values()),
+            "deferred": sorted(self._paths),
+        }
+
+
+
+def benchmark_startup(module: str, registry: str, use: str, plugin_source: Callable[[int], str], modules: int = 300) -> Dict[str, Any]:
+    """
+    임시 디렉터리에 플러그인 모듈 `modules`개를 만들고, 새 인터프리터에서 모두 미리 임포트할 때와
+    경로만 등록한 뒤 하나만 사용할 때의 시작 시간을 비교합니다.
+
+    `plugin_source(index)`는 `plugin{index}` 키로 등록되는 `Plugin{index}` 클래스의 소스를 반환합니다.
+    `registry`는 `module` 안에서 레지스트리에 이르는 속성 경로이고, `use`는 `module`을 임포트한 뒤
+    `plugin0`을 사용하는 문장입니다.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as plugins:
+        for index in range(modules):
+            with open(os.path.join(plugins, f"plugin_{index}.py"), "w", encoding="utf-8") as plugin:
+                plugin.write(plugin_source(index))
+
+        eager = (
+            f"import importlib\n"
+            f"for index in range({modules}):\n"
+            f"    importlib.import_module(f'plugin_{{index}}')\n"
+            f"import {module}\n"
+            f"{use}\n"
+        )
+        lazy = (
+            f"import json\n"
+            f"import {module}\n"
+            f"for index in range({modules}):\n"
+            f"    {module}.{registry}.register_path(f'plugin{{index}}', f'plugin_{{index}}:Plugin{{index}}')\n"
+            f"{use}\n"
+            f"print(json.dumps({module}.{registry}.report()))\n"
+        )
+
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([here, plugins]), PYTHONDONTWRITEBYTECODE="1")
+        results: Dict[str, Any] = {}
+        for name, code in (("eager", eager), ("lazy", lazy)):
+            start = time.perf_counter()
+            output = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout
+            results[f"{name}_seconds"] = time.perf_counter() - start
+        report = json.loads(output)
+        results["deferred_modules"] = len(report["deferred"])
+        results["saved_seconds"] = results["eager_seconds"] - results["lazy_seconds"]
+        return results
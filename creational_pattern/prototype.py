@@ -1,4 +1,10 @@
 import copy
+import sys
+import time
+import tracemalloc
+from enum import Enum
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Any, Callable, Dict, List, Optional, Set
 
 
 class SelfReferencingEntity:
@@ -27,14 +33,9 @@ class SomeComponent:
         반환된 값이 새로운 얕은 복사본으로 반환됩니다.
         """
 
-        # 먼저, 중첩된 객체들을 복사합니다.
-        some_list_of_objects = copy.copy(self.some_list_of_objects)
-        some_circular_ref = copy.copy(self.some_circular_ref)
-
-        # 그런 다음, 준비된 중첩 객체들의 복사본을 사용하여 객체 자체를 복제합니다.
-        new = self.__class__(
-            self.some_int, self.some_list_of_objects, self.some_circular_ref
-        )
+        # 얕은 복사본은 중첩 객체를 원본과 공유하므로 중첩 객체를 따로 복사할 필요가 없습니다.
+        # `__init__`을 다시 실행하지 않고 새 객체 하나만 할당한 뒤 속성을 그대로 옮깁니다.
+        new = self.__class__.__new__(self.__class__)
         new.__dict__.update(self.__dict__)
 
         return new
@@ -50,20 +51,651 @@ class SomeComponent:
         if memo is None:
             memo = {}
 
-        # 먼저, 중첩된 객체들을 복사합니다.
-        some_list_of_objects = copy.deepcopy(self.some_list_of_objects, memo)
-        some_circular_ref = copy.deepcopy(self.some_circular_ref, memo)
+        # 먼저, 새 객체를 memo에 등록합니다. 중첩 객체를 복사하는 도중 순환 참조가 이 객체를 다시 만나면
+        # 또 하나의 사본을 만들지 않고 이 복제본을 가리키게 됩니다.
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
 
-        # 그런 다음, 준비된 중첩 객체들의 복사본을 사용하여 객체 자체를 복제합니다.
-        new = self.__class__(
-            self.some_int, some_list_of_objects, some_circular_ref
-        )
-        new.__dict__ = copy.deepcopy(self.__dict__, memo)
+        # 그런 다음, 중첩된 객체들을 복사하여 복제본을 채웁니다.
+        new.__dict__.update(copy.deepcopy(self.__dict__, memo))
+
+        return new
+
+    def cow_clone(self):
+        """
+        쓰기 시 복사(copy-on-write) 복제본을 생성합니다.
+
+        복제본의 리스트, 사전, 집합 속성은 `CowView`가 되어, 중첩 컨테이너나 그 안의 객체를 변경하려 할 때
+        그 경로에 있는 것만 비공개로 복사합니다. 원본의 속성은 바꾸지 않습니다.
+
+        원본이 실제 컨테이너를 가지고 있다면 원본의 이후 변경을 막을 수 없으므로, 한 번 깊은 복사하여 공유할 스냅숏을 만듭니다.
+        쓰기 시 복사 복제본을 다시 복제할 때는 그 데이터를 그대로 공유하므로 복제 비용이 그래프 크기가 아니라
+        속성 수에 비례합니다. 따라서 여러 번 복제할 때는 처음 만든 복제본을 프로토타입으로 삼아 복제합니다.
+        """
+        new = self.__class__.__new__(self.__class__)
+        context = CowContext()
+        # 원본을 가리키는 역참조는 복제본을 가리키도록 memo에 등록합니다.
+        memo = {id(self): new}
+
+        for name, value in self.__dict__.items():
+            if isinstance(value, CowView):
+                # 이 객체가 소유한 데이터도 이제 새 복제본과 공유되므로, 이미 꺼내 둔 뷰를 포함해
+                # 이 객체의 다음 쓰기가 다시 복사하도록 소유권을 내려놓습니다.
+                value._context.disown_all()
+                new.__dict__[name] = CowView(context, root=value.materialize())
+            elif isinstance(value, COW_TYPES):
+                new.__dict__[name] = CowView(context, root=copy.deepcopy(value, memo))
+            else:
+                new.__dict__[name] = copy.deepcopy(value, memo)
+
+        return new
+
+
+
+class SlottedComponent:
+    """
+    `__slots__`를 사용하는 SomeComponent의 변형입니다.
+    인스턴스마다 `__dict__`가 없으므로 메모리를 덜 쓰고, 복사 시 속성을 직접 옮깁니다.
+    """
+
+    __slots__ = ("some_int", "some_list_of_objects", "some_circular_ref")
+
+    def __init__(self, some_int, some_list_of_objects, some_circular_ref):
+        self.some_int = some_int
+        self.some_list_of_objects = some_list_of_objects
+        self.some_circular_ref = some_circular_ref
 
+    def __copy__(self):
+        new = self.__class__.__new__(self.__class__)
+        new.some_int = self.some_int
+        new.some_list_of_objects = self.some_list_of_objects
+        new.some_circular_ref = self.some_circular_ref
+        return new
+
+    def __deepcopy__(self, memo=None):
+        if memo is None:
+            memo = {}
+
+        # 중첩 객체를 복사하기 전에 새 객체를 memo에 등록해야 순환 참조가 이 복제본을 가리킵니다.
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        new.some_int = self.some_int
+        new.some_list_of_objects = copy.deepcopy(self.some_list_of_objects, memo)
+        new.some_circular_ref = copy.deepcopy(self.some_circular_ref, memo)
         return new
 
 
 
+COW_TYPES = (list, dict, set)
+
+COW_MUTATORS = {
+    list: frozenset({"append", "extend", "insert", "pop", "remove", "sort", "reverse", "clear"}),
+    dict: frozenset({"pop", "popitem", "update", "setdefault", "clear"}),
+    set: frozenset({
+        "add", "discard", "remove", "pop", "clear", "update",
+        "difference_update", "intersection_update", "symmetric_difference_update",
+    }),
+}
+
+
+
+class CowContext:
+    """
+    쓰기 시 복사로 복제된 객체 하나가 비공개로 소유한 컨테이너들을 기록합니다.
+    여기에 없는 컨테이너는 다른 복제본과 공유 중이므로 변경 전에 복사해야 합니다.
+    """
+
+    def __init__(self) -> None:
+        # id만 저장하면 객체가 해제된 뒤 id가 재사용될 수 있으므로 객체도 함께 붙잡아 둡니다.
+        self._owned: Dict[int, Any] = {}
+
+    def owns(self, data: Any) -> bool:
+        return id(data) in self._owned
+
+    def own(self, data: Any) -> None:
+        self._owned[id(data)] = data
+
+    def disown_all(self) -> None:
+        """
+        소유한 데이터가 다른 뷰와 공유되기 시작했을 때 호출합니다. 이후의 쓰기는 경로를 다시 복사합니다.
+        """
+        self._owned.clear()
+
+
+
+class CowView:
+    """
+    공유 중일 수 있는 리스트, 사전, 집합, 일반 객체에 대한 쓰기 시 복사 뷰입니다.
+
+    뷰는 (부모 뷰, 슬롯) 경로로 자신의 위치를 기억하며 접근할 때마다 데이터를 다시 찾습니다.
+    슬롯은 컨테이너에서는 인덱스나 키이고, 일반 객체에서는 속성 이름입니다.
+    읽기는 공유 데이터를 그대로 사용하고, 쓰기는 루트부터 이 위치까지의 컨테이너와 객체만 복사한 뒤 수행합니다.
+    리스트 원소 뷰는 인덱스를 기억하므로, 부모 리스트에 삽입이나 삭제가 일어나면 다시 꺼내야 합니다.
+
+    중첩된 값을 돌려주는 연산(인덱싱, 속성 접근, 반복, `get`, `values`, `items`, `setdefault`)은 뷰를 돌려줍니다.
+    슬라이스, `copy`, `pop`, `popitem`처럼 경로에서 떨어져 나온 값은 자신만의 컨텍스트를 가진 독립된 뷰로 돌려줍니다.
+    일반 객체의 메서드를 호출하면 그 메서드가 객체를 변경할 수 있으므로 먼저 객체를 복사합니다.
+    집합의 원소는 경로로 가리킬 수 없으므로 그대로 반환되며, 변경하면 안 됩니다.
+    """
+
+    __slots__ = ("_context", "_parent", "_slot", "_root")
+
+    def __init__(self, context: CowContext, root: Any = None, parent: Optional["CowView"] = None, slot: Any = None) -> None:
+        object.__setattr__(self, "_context", context)
+        object.__setattr__(self, "_root", root)
+        object.__setattr__(self, "_parent", parent)
+        object.__setattr__(self, "_slot", slot)
+
+    def materialize(self) -> Any:
+        """
+        현재 위치의 실제 데이터를 반환합니다. 공유 중일 수 있으므로 읽기 전용으로만 사용해야 합니다.
+        """
+        if self._parent is None:
+            return self._root
+        data = self._parent.materialize()
+        if isinstance(data, COW_TYPES):
+            return data[self._slot]
+        return getattr(data, self._slot)
+
+    def _writable(self) -> Any:
+        data = self.materialize()
+        if self._context.owns(data):
+            return data
+        private = copy.copy(data)
+        self._context.own(private)
+        if self._parent is None:
+            object.__setattr__(self, "_root", private)
+        else:
+            parent = self._parent._writable()
+            if isinstance(parent, COW_TYPES):
+                parent[self._slot] = private
+            else:
+                setattr(parent, self._slot, private)
+        return private
+
+    def _wrap(self, slot: Any, value: Any) -> Any:
+        if _is_cow_target(value):
+            return CowView(self._context, parent=self, slot=slot)
+        return value
+
+    def _share(self, data: Any) -> Any:
+        """
+        경로에서 떨어져 나가는 데이터를 독립된 뷰로 감쌉니다. 새 컨텍스트는 아무것도 소유하지 않으므로 쓰기 전에 복사합니다.
+        """
+        if _is_cow_target(data):
+            return CowView(CowContext(), root=data)
+        return data
+
+    def _unwrap(self, value: Any) -> Any:
+        if not isinstance(value, CowView):
+            return value
+        if value._context is self._context:
+            return value.materialize()
+        # 다른 복제본의 데이터는 그쪽에서 제자리 변경될 수 있으므로 공유하지 않습니다.
+        return copy.deepcopy(value.materialize())
+
+    def __getitem__(self, key: Any) -> Any:
+        data = self.materialize()
+        if isinstance(key, slice):
+            # 슬라이스의 원소는 이 복제본이 소유한 컨테이너일 수 있으므로 소유권을 내려놓아 다음 쓰기 때 다시 복사하게 합니다.
+            self._context.disown_all()
+            return self._share(data[key])
+        return self._wrap(key, data[key])
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._writable()[key] = self._unwrap(value)
+
+    def __delitem__(self, key: Any) -> None:
+        del self._writable()[key]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._writable(), name, self._unwrap(value))
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._writable(), name)
+
+    def __iter__(self):
+        data = self.materialize()
+        if isinstance(data, list):
+            return (self._wrap(index, value) for index, value in enumerate(data))
+        return iter(data)
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.materialize()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CowView):
+            other = other.materialize()
+        return self.materialize() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.materialize())
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Any:
+        # 깊은 복사본은 더 이상 공유할 것이 없으므로 평범한 컨테이너로 돌려줍니다.
+        return copy.deepcopy(self.materialize(), memo)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        data = self.materialize()
+        if key in data:
+            return self._wrap(key, data[key])
+        return default
+
+    def values(self) -> List[Any]:
+        return [self._wrap(key, value) for key, value in self.materialize().items()]
+
+    def items(self) -> List[Any]:
+        return [(key, self._wrap(key, value)) for key, value in self.materialize().items()]
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self._writable().setdefault(key, self._unwrap(default))
+        return self[key]
+
+    def pop(self, *args: Any) -> Any:
+        return self._share(self._writable().pop(*args))
+
+    def popitem(self) -> Any:
+        key, value = self._writable().popitem()
+        return key, self._share(value)
+
+    def copy(self) -> "CowView":
+        self._context.disown_all()
+        return CowView(CowContext(), root=self.materialize())
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        data = self.materialize()
+        if isinstance(data, COW_TYPES):
+            if name in COW_MUTATORS[type(data)]:
+                return getattr(self._writable(), name)
+            return getattr(data, name)
+        value = getattr(data, name)
+        if callable(value):
+            return getattr(self._writable(), name)
+        return self._wrap(name, value)
+
+
+
+def _is_cow_target(value: Any) -> bool:
+    """
+    쓰기 시 복사 뷰로 감싸야 하는 값인지 확인합니다. 컨테이너와 `__dict__`를 가진 일반 객체가 해당합니다.
+    """
+    if isinstance(value, COW_TYPES):
+        return True
+    return hasattr(value, "__dict__") and not is_atom(value) and not callable(value)
+
+
+
+ATOM_TYPES = frozenset({int, float, complex, bool, str, bytes, type(None)})
+
+ATOM_CLASSES = (type, FunctionType, BuiltinFunctionType, ModuleType, Enum)
+"""
+`copy.deepcopy`가 복사하지 않고 그대로 공유하는 값들입니다. 클래스, 함수, 모듈, 열거형 멤버가 여기에 해당합니다.
+"""
+
+
+def is_atom(value: Any) -> bool:
+    """
+    복제할 필요 없이 공유해도 되는 불변 값인지 확인합니다.
+    """
+    kind = type(value)
+    if kind in ATOM_TYPES:
+        return True
+    if kind is tuple or kind is frozenset:
+        return all(is_atom(item) for item in value)
+    return isinstance(value, ATOM_CLASSES)
+
+
+
+FIELDWISE_DEEPCOPY = frozenset({SomeComponent.__deepcopy__})
+"""
+`__dict__`의 값을 하나씩 깊은 복사하는 것과 결과가 같은 `__deepcopy__` 구현들입니다.
+이 구현을 쓰는 클래스는 복사 규칙이 없는 클래스처럼 구조 분석으로 복제합니다.
+"""
+
+
+def _is_plain_object(node: Any) -> bool:
+    """
+    `__dict__`만 옮겨서 다시 만들 수 있는 평범한 객체인지 확인합니다.
+    `__deepcopy__`, `__reduce_ex__`, `__setstate__` 등으로 자신만의 복사 규칙을 정한 클래스는 깊은 복사에 맡깁니다.
+    """
+    kind = type(node)
+    deepcopy = getattr(kind, "__deepcopy__", None)
+    return (
+        hasattr(node, "__dict__")
+        and (deepcopy is None or deepcopy in FIELDWISE_DEEPCOPY)
+        and not hasattr(kind, "__setstate__")
+        and kind.__reduce_ex__ is object.__reduce_ex__
+        and kind.__reduce__ is object.__reduce__
+    )
+
+
+
+def _is_compilable(node: Any) -> bool:
+    return type(node) in (list, tuple, set, dict) or _is_plain_object(node)
+
+
+
+def _children(node: Any) -> List[Any]:
+    if type(node) in (list, tuple, set):
+        return list(node)
+    if type(node) is dict:
+        return list(node.values())
+    if _is_plain_object(node):
+        return list(node.__dict__.values())
+    return []
+
+
+
+def compile_cloner(prototype: Any) -> Callable[[], Any]:
+    """
+    주어진 프로토타입의 구조에 특화된 복제 함수를 만듭니다.
+
+    등록 시점에 객체 그래프를 한 번 훑어 각 노드가 불변 값인지, 어떤 컨테이너인지,
+    여러 곳에서 참조되는지(순환 참조 포함)를 미리 결정합니다. 만들어진 함수는 `copy.deepcopy`처럼
+    매번 타입을 조사하거나 memo 사전을 쓰지 않고, 여러 번 참조되는 노드만 고정 크기 슬롯 리스트로 추적합니다.
+    프로토타입은 이 함수가 참조하는 템플릿이 되므로 이후에 변경하면 안 됩니다.
+
+    순환 참조에 튜플이 포함된 그래프는 튜플을 다 만들기 전에 참조해야 하므로 `copy.deepcopy`로 복제합니다.
+    """
+    counts: Dict[int, int] = {}
+    fallbacks = []
+    stack = [prototype]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, CowView):
+            node = node.materialize()
+        if is_atom(node):
+            continue
+        counts[id(node)] = counts.get(id(node), 0) + 1
+        if counts[id(node)] == 1:
+            if _is_compilable(node):
+                stack.extend(_children(node))
+            else:
+                fallbacks.append(node)
+
+    # 깊은 복사로 처리하는 객체 안에서도 참조되는 노드는 깊은 복사와 같은 memo를 거쳐 만들어야 사본이 하나로 유지됩니다.
+    # 그런 노드는 등록 시점에 한 번 깊은 복사해 보고 memo에 남은 원본들로 찾습니다.
+    memo: Dict[int, Any] = {}
+    for node in fallbacks:
+        copy.deepcopy(node, memo)
+    through_memo = {node_id for node_id in memo if node_id in counts}
+    del memo
+
+    slots = {
+        node_id: index
+        for index, node_id in enumerate(
+            node_id for node_id, count in counts.items() if count > 1 and node_id not in through_memo
+        )
+    }
+
+    try:
+        build = _compile_node(prototype, slots, through_memo, {}, set())
+    except _CyclicTuple:
+        return lambda: copy.deepcopy(prototype)
+    size = len(slots)
+
+    def clone() -> Any:
+        # 마지막 칸은 깊은 복사로 처리하는 객체들이 함께 쓰는 memo입니다.
+        return build([None] * size + [{}])
+
+    return clone
+
+
+
+class _CyclicTuple(Exception):
+    pass
+
+
+
+def _compile_node(
+        node: Any, slots: Dict[int, int], through_memo: Set[int], compiled: Dict[int, Callable], tuples: Set[int],
+) -> Optional[Callable]:
+    """
+    노드 하나의 빌더 `build(refs)`를 반환합니다. 공유해도 되는 노드는 None을 반환합니다.
+    `tuples`는 자식을 컴파일하는 중인 튜플들로, 그중 하나를 다시 만나면 튜플이 순환 참조에 포함된 것입니다.
+    """
+    if isinstance(node, CowView):
+        node = node.materialize()
+    if is_atom(node):
+        return None
+    if id(node) in compiled:
+        return compiled[id(node)]
+    if id(node) in tuples:
+        raise _CyclicTuple
+
+    kind = type(node)
+    key = id(node)
+    slot = slots.get(key)
+    memoized = key in through_memo
+
+    if not _is_compilable(node):
+        # 알 수 없는 객체나 자체 복사 규칙이 있는 객체는 일반적인 깊은 복사로 처리합니다.
+        # 한 번의 복제 안에서는 memo를 공유하므로 여러 곳에서 참조되어도 하나의 사본만 만들어집니다.
+        def fallback(refs):
+            return copy.deepcopy(node, refs[-1])
+        compiled[key] = fallback
+        return fallback
+
+    if kind is not tuple:
+        # 순환 참조가 이 빌더를 다시 요청할 수 있으므로 자식을 컴파일하기 전에 등록합니다.
+        # 자식을 채우기 전에 빈 객체를 슬롯이나 memo에 넣어 두므로 순환 참조도 같은 사본을 가리킵니다.
+        if memoized:
+            def aliased(refs):
+                memo = refs[-1]
+                obj = memo.get(key)
+                if obj is None:
+                    obj = memo[key] = shell()
+                    fill(obj, refs)
+                return obj
+            compiled[key] = aliased
+        elif slot is not None:
+            def aliased(refs):
+                obj = refs[slot]
+                if obj is None:
+                    obj = refs[slot] = shell()
+                    fill(obj, refs)
+                return obj
+            compiled[key] = aliased
+
+    if kind is list or kind is tuple:
+        items = list(enumerate(node))
+    elif kind is set:
+        items = [(None, item) for item in node]
+    elif kind is dict:
+        items = list(node.items())
+    else:
+        items = list(node.__dict__.items())
+
+    patches: List = []
+    if kind is tuple:
+        tuples.add(key)
+    try:
+        for item_key, value in items:
+            builder = _compile_node(value, slots, through_memo, compiled, tuples)
+            if builder is not None:
+                patches.append((item_key, builder))
+    finally:
+        tuples.discard(key)
+
+    if kind is tuple:
+        def build_tuple(refs):
+            items = list(node)
+            for index, builder in patches:
+                items[index] = builder(refs)
+            return tuple(items)
+
+        # 튜플은 자식을 모두 만든 뒤에야 만들 수 있으므로, 만든 다음에 슬롯이나 memo에 넣어 재사용합니다.
+        if memoized:
+            def shared_tuple(refs):
+                memo = refs[-1]
+                obj = memo.get(key)
+                if obj is None:
+                    obj = memo[key] = build_tuple(refs)
+                return obj
+        elif slot is not None:
+            def shared_tuple(refs):
+                obj = refs[slot]
+                if obj is None:
+                    obj = refs[slot] = build_tuple(refs)
+                return obj
+        else:
+            shared_tuple = build_tuple
+        compiled[key] = shared_tuple
+        return shared_tuple
+
+    if kind is set:
+        atoms = {item for item in node if is_atom(item)}
+        shell = set
+
+        def fill(obj, refs):
+            obj.update(atoms)
+            for _, builder in patches:
+                obj.add(builder(refs))
+    elif kind is list or kind is dict:
+        shell = kind
+
+        if kind is list:
+            def fill(obj, refs):
+                obj.extend(node)
+                for index, builder in patches:
+                    obj[index] = builder(refs)
+        else:
+            def fill(obj, refs):
+                obj.update(node)
+                for item_key, builder in patches:
+                    obj[item_key] = builder(refs)
+    else:
+        def shell():
+            return kind.__new__(kind)
+
+        def fill(obj, refs):
+            state = node.__dict__.copy()
+            for name, builder in patches:
+                state[name] = builder(refs)
+            obj.__dict__.update(state)
+
+    if memoized or slot is not None:
+        return compiled[key]
+
+    if not patches and kind in (list, dict, set):
+        # 불변 값만 담은 컨테이너는 C 수준의 얕은 복사 한 번이면 됩니다.
+        build = node.copy
+        compiled[key] = lambda refs: build()
+        return compiled[key]
+
+    def direct(refs):
+        obj = shell()
+        fill(obj, refs)
+        return obj
+    compiled[key] = direct
+    return direct
+
+
+
+class PrototypeRegistry:
+    """
+    이름으로 프로토타입을 등록하고 복제하는 레지스트리입니다.
+    등록할 때 프로토타입을 깊은 복사하여 고정하고, 그 구조에 특화된 복제 함수를 한 번만 만들어 재사용합니다.
+    """
+
+    def __init__(self) -> None:
+        self._prototypes: Dict[str, Any] = {}
+        self._cloners: Dict[str, Callable[[], Any]] = {}
+
+    def register(self, name: str, prototype: Any) -> None:
+        # 클래스별 `__deepcopy__`에 의존하지 않도록, 고정본도 구조 분석으로 만든 복제 함수로 만듭니다.
+        frozen = compile_cloner(prototype)()
+        self._prototypes[name] = frozen
+        self._cloners[name] = compile_cloner(frozen)
+
+    def unregister(self, name: str) -> None:
+        del self._prototypes[name]
+        del self._cloners[name]
+
+    def clone(self, name: str) -> Any:
+        return self._cloners[name]()
+
+
+
+def benchmark_registry(clones: int = 100_000) -> Dict[str, float]:
+    """
+    같은 프로토타입을 반복 복제할 때 `copy.deepcopy`와 레지스트리의 초당 복제 수를 비교합니다.
+    """
+    circular_ref = SelfReferencingEntity()
+    component = SomeComponent(23, [1, {1, 2, 3}, [1, 2, 3]], circular_ref)
+    circular_ref.set_parent(component)
+
+    registry = PrototypeRegistry()
+    registry.register("component", component)
+
+    results = {}
+    for name, clone in (
+            ("deepcopy", lambda: copy.deepcopy(component)),
+            ("registry", lambda: registry.clone("component")),
+    ):
+        start = time.perf_counter()
+        for _ in range(clones):
+            clone()
+        results[name] = clones / (time.perf_counter() - start)
+    return results
+
+
+
+def benchmark_copies(copies: int = 100_000) -> Dict[str, float]:
+    """
+    SomeComponent와 SlottedComponent의 얕은 복사, 깊은 복사 초당 횟수를 측정합니다.
+    """
+    results = {}
+    for component_class in (SomeComponent, SlottedComponent):
+        circular_ref = SelfReferencingEntity()
+        component = component_class(23, [1, {1, 2, 3}, [1, 2, 3]], circular_ref)
+        circular_ref.set_parent(component)
+        for name, clone in (("copy", copy.copy), ("deepcopy", copy.deepcopy)):
+            start = time.perf_counter()
+            for _ in range(copies):
+                clone(component)
+            results[f"{component_class.__name__}.{name}"] = copies / (time.perf_counter() - start)
+    return results
+
+
+
+def benchmark_clone(sizes=(10_000, 100_000, 1_000_000)) -> Dict[int, Dict[str, float]]:
+    """
+    노드 수별로 `copy.deepcopy`와 `cow_clone`의 복제 시간과 추가 메모리를 비교합니다.
+    쓰기 시 복사는 원본에서 한 번 만든 복제본을 프로토타입으로 삼아 복제하며, 복제 후 노드 하나를 변경하는 비용까지 포함합니다.
+    """
+    results = {}
+    for size in sizes:
+        circular_ref = SelfReferencingEntity()
+        component = SomeComponent(size, [[index] for index in range(size)], circular_ref)
+        circular_ref.set_parent(component)
+        prototype = component.cow_clone()
+
+        row = {}
+        for name, clone in (
+                ("deepcopy", lambda: copy.deepcopy(component)),
+                ("cow_clone", lambda: prototype.cow_clone()),
+        ):
+            tracemalloc.start()
+            start = time.perf_counter()
+            cloned = clone()
+            cloned.some_list_of_objects[size // 2].append(-1)
+            row[f"{name}_seconds"] = time.perf_counter() - start
+            row[f"{name}_bytes"] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del cloned
+        results[size] = row
+    return results
+
+
+
 
 if __name__ == "__main__":
     list_of_objects = [1, {1,2,3}, [1,2,3]]
@@ -141,4 +773,44 @@ if __name__ == "__main__":
         "반복적으로 복제되지 않음을 보여줍니다."
     )
 
+    # 원본에서 만든 쓰기 시 복사 복제본을 프로토타입으로 삼으면, 그 복제본들은 데이터를 공유합니다.
+    cow_prototype = component.cow_clone()
+    cow_copied_component = cow_prototype.cow_clone()
+
+    # cow_copied_component의 중첩 집합을 변경하면 그 경로만 비공개로 복사됩니다.
+    cow_copied_component.some_list_of_objects[1].add(100)
+    if 100 in cow_prototype.some_list_of_objects[1]:
+        print("cow_copied_component의 집합을 변경하면 cow_prototype의 집합도 변경됩니다.")
+    else:
+        print("cow_copied_component의 집합을 변경해도 cow_prototype의 집합은 변경되지 않습니다.")
+
+    shared = (
+        cow_copied_component.some_list_of_objects[2].materialize()
+        is cow_prototype.some_list_of_objects[2].materialize()
+    )
+    if shared:
+        print("변경하지 않은 some_list_of_objects[2]는 여전히 두 복제본이 공유합니다.")
+    if isinstance(component.some_list_of_objects, list):
+        print("원본 component의 속성은 그대로 실제 리스트입니다.")
+
+    registry = PrototypeRegistry()
+    registry.register("component", component)
+    registry_copied_component = registry.clone("component")
+    if (
+        registry_copied_component.some_circular_ref.parent is registry_copied_component
+        and registry_copied_component.some_list_of_objects[1] is not registry._prototypes["component"].some_list_of_objects[1]
+    ):
+        print("레지스트리 복제본은 순환 참조를 유지하면서 중첩 객체를 새로 만듭니다.")
+
+    if "--bench" in sys.argv[1:]:
+        for name, rate in benchmark_copies().items():
+            print(f"{name}: 초당 {rate:,.0f}회 복제")
+        for name, rate in benchmark_registry().items():
+            print(f"{name}: 초당 {rate:,.0f}회 복제")
+        for size, row in benchmark_clone().items():
+            print(
+                f"{size:>9,}개 노드: deepcopy {row['deepcopy_seconds']:.4f}초/{row['deepcopy_bytes']:,}바이트, "
+                f"cow_clone {row['cow_clone_seconds']:.4f}초/{row['cow_clone_bytes']:,}바이트"
+            )
+
 # python creational_pattern/prototype.py
@@ -1,5 +1,7 @@
-from threading import Lock, Thread
-from typing import Any
+import sys
+import time
+from threading import Barrier, Lock, Thread
+from typing import Any, Dict
 
 
 
@@ -10,19 +12,31 @@ class SingletonMeta(type):
 
     _instances = {}
 
-    _lock: Lock = Lock()
+    _locks: Dict[type, Lock] = {}
     """
     이제 싱글톤에 첫 접근 시 스레드를 동기화하는 데 사용될 락 객체를 가지고 있습니다.
+    락은 싱글톤 클래스마다 하나씩 있으므로, 서로 다른 싱글톤을 처음 만드는 스레드끼리는 경쟁하지 않습니다.
     """
 
+    def __init__(cls, name, bases, namespace, **kwargs) -> None:
+        super().__init__(name, bases, namespace, **kwargs)
+        # 클래스가 정의되는 시점에 락을 만들어 두면 락 생성 자체를 동기화할 필요가 없습니다.
+        SingletonMeta._locks[cls] = Lock()
+
     def __call__(cls, *args, **kwargs):
         """
         `__init__` 인수의 값 변경은 반환된 인스턴스에 영향을 미치지 않습니다.
         """
+        # 인스턴스가 이미 만들어진 뒤에는 락 없이 바로 반환합니다.
+        # 인스턴스는 생성이 끝난 뒤에만 사전에 등록되므로 덜 만들어진 객체를 볼 일은 없습니다.
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+
         # 이제 프로그램이 막 시작되었다고 가정해보면, 아직 싱글톤 인스턴스가 없으므로
         # 여러 스레드가 이전 조건문을 동시에 통과하여 거의 동시에 이 지점에 도달할 수 있습니다.
         # 그 중 첫 번째 스레드는 락을 획득하고 계속 진행하는 반면, 나머지 스레드는 여기서 대기합니다.
-        with cls._lock:
+        with SingletonMeta._locks[cls]:
             # 락을 획득한 첫 번째 스레드는 이 조건문에 도달하여
             # 내부로 들어가 싱글톤 인스턴스를 생성합니다.
             # 락 블록을 벗어나면 락 해제를 기다리고 있던 다른 스레드가 이 섹션에 진입할 수 있습니다.
@@ -42,7 +56,7 @@ class Singleton(metaclass=SingletonMeta):
 
     def __init__(self, value: str) -> None:
         self.value = value
-    
+
     def some_business_logic(self):
         """
         마지막으로, 모든 싱글톤은 인스턴스에서 실행될 수 있는 일부 비즈니스 로직을 정의해야 합니다.
@@ -56,6 +70,48 @@ def test_singleton(value: str) -> None:
 
 
 
+def benchmark_contention(threads: int = 64, calls: int = 20_000) -> Dict[str, float]:
+    """
+    여러 스레드가 동시에 `Singleton()`을 호출할 때의 초당 호출 수를 측정합니다.
+    매 호출마다 하나의 전역 락을 잡던 이전 구현과 비교합니다.
+    """
+
+    class GlobalLockSingletonMeta(type):
+        _instances = {}
+        _lock: Lock = Lock()
+
+        def __call__(cls, *args, **kwargs):
+            with cls._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super().__call__(*args, **kwargs)
+            return cls._instances[cls]
+
+    class GlobalLockSingleton(metaclass=GlobalLockSingletonMeta):
+        def __init__(self, value: str) -> None:
+            self.value = value
+
+    results = {}
+    for target in (GlobalLockSingleton, Singleton):
+        barrier = Barrier(threads + 1)
+
+        def hammer() -> None:
+            barrier.wait()
+            for _ in range(calls):
+                target("BENCH")
+
+        workers = [Thread(target=hammer) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        results[target.__name__] = threads * calls / elapsed
+    return results
+
+
+
 if __name__ == "__main__":
     # 클라이언트 코드
 
@@ -63,10 +119,16 @@ if __name__ == "__main__":
         "같은 값이 보이면 싱글톤이 재사용된 것입니다."
         "다른 값이 보이면 두 개의 싱글톤이 생성된 것입니다."
         )
-    
+
     process1 = Thread(target=test_singleton, args=("FOO",))
     process2 = Thread(target=test_singleton, args=("BAR",))
     process1.start()
     process2.start()
 
+    if "--bench" in sys.argv[1:]:
+        process1.join()
+        process2.join()
+        for name, rate in benchmark_contention().items():
+            print(f"{name}: 64개 스레드에서 초당 {rate:,.0f}회 호출")
+
 # python creational_pattern/thread_safe_singleton.py
@@ -0,0 +1,258 @@
+from __future__ import annotations
+import gc
+import sys
+import time
+import tracemalloc
+from array import array
+from typing import List, Optional, Sequence
+
+from composite import Component, Composite, Leaf, fold
+
+
+
+LEAF = 0
+COMPOSITE = 1
+NO_NODE = -1
+
+
+
+class CompactTree:
+    """
+    트리 전체를 병렬 배열에 보관하는 저장소입니다.
+
+    노드 하나는 객체가 아니라 정수 인덱스이며, 종류(kind), 부모, 첫 자식, 마지막 자식, 이전/다음 형제를
+    각각의 배열에 기록합니다. 노드당 21바이트만 쓰므로 수천만 개의 노드도 객체 트리보다 훨씬 적은 메모리로 다룰 수 있습니다.
+    클라이언트는 `leaf()`와 `composite()`가 돌려주는 가벼운 뷰를 통해 기존 Component 인터페이스로 트리를 다룹니다.
+
+    제거된 노드의 자리는 재사용하지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._kind = array("b")
+        self._parent = array("i")
+        self._first_child = array("i")
+        self._last_child = array("i")
+        self._prev_sibling = array("i")
+        self._next_sibling = array("i")
+
+    def __len__(self) -> int:
+        return len(self._kind)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self._kind, self._parent, self._first_child, self._last_child, self._prev_sibling, self._next_sibling)
+        return sum(column.itemsize * len(column) for column in arrays)
+
+    def _new(self, kind: int) -> int:
+        self._kind.append(kind)
+        for column in (self._parent, self._first_child, self._last_child, self._prev_sibling, self._next_sibling):
+            column.append(NO_NODE)
+        return len(self._kind) - 1
+
+    def leaf(self) -> CompactLeaf:
+        return CompactLeaf(self, self._new(LEAF))
+
+    def composite(self) -> CompactComposite:
+        return CompactComposite(self, self._new(COMPOSITE))
+
+    def view(self, index: int) -> Optional[Component]:
+        if index == NO_NODE:
+            return None
+        if self._kind[index] == COMPOSITE:
+            return CompactComposite(self, index)
+        return CompactLeaf(self, index)
+
+    def _attach(self, parent: int, child: int) -> None:
+        if self._parent[child] != NO_NODE:
+            self._detach(child)
+        last = self._last_child[parent]
+        if last == NO_NODE:
+            self._first_child[parent] = child
+        else:
+            self._next_sibling[last] = child
+        self._prev_sibling[child] = last
+        self._last_child[parent] = child
+        self._parent[child] = parent
+
+    def _detach(self, child: int) -> None:
+        parent = self._parent[child]
+        prev, following = self._prev_sibling[child], self._next_sibling[child]
+        if prev == NO_NODE:
+            self._first_child[parent] = following
+        else:
+            self._next_sibling[prev] = following
+        if following == NO_NODE:
+            self._last_child[parent] = prev
+        else:
+            self._prev_sibling[following] = prev
+        self._parent[child] = self._prev_sibling[child] = self._next_sibling[child] = NO_NODE
+
+    def child_indices(self, index: int) -> List[int]:
+        result = []
+        next_sibling = self._next_sibling
+        child = self._first_child[index]
+        while child != NO_NODE:
+            result.append(child)
+            child = next_sibling[child]
+        return result
+
+
+
+class CompactComponent(Component):
+    """
+    CompactTree의 노드 하나를 가리키는 뷰입니다. 트리와 인덱스만 가지므로 필요할 때 만들고 버려도 됩니다.
+    같은 노드를 가리키는 뷰들은 서로 같다고 비교됩니다.
+    """
+
+    __slots__ = ("_tree", "_index")
+
+    def __init__(self, tree: CompactTree, index: int) -> None:
+        self._tree = tree
+        self._index = index
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CompactComponent) and other._tree is self._tree and other._index == self._index
+
+    def __hash__(self) -> int:
+        return hash((id(self._tree), self._index))
+
+    @property
+    def parent(self) -> Optional[Component]:
+        return self._tree.view(self._tree._parent[self._index])
+
+    @parent.setter
+    def parent(self, parent: Optional[Component]) -> None:
+        if parent is None:
+            if self._tree._parent[self._index] != NO_NODE:
+                self._tree._detach(self._index)
+        else:
+            parent.add(self)
+
+    def invalidate(self) -> None:
+        """
+        뷰는 결과를 캐시하지 않으므로 무효화할 것이 없습니다.
+        """
+
+
+
+class CompactLeaf(CompactComponent):
+    __slots__ = ()
+
+    def operation(self) -> str:
+        return "Leaf"
+
+
+
+class CompactComposite(CompactComponent):
+    __slots__ = ()
+
+    def _own(self, component: Component) -> int:
+        if not isinstance(component, CompactComponent) or component._tree is not self._tree:
+            raise ValueError("같은 CompactTree의 노드만 자식으로 다룰 수 있습니다.")
+        return component._index
+
+    def add(self, component: Component) -> None:
+        self._tree._attach(self._index, self._own(component))
+
+    def remove(self, component: Component) -> None:
+        index = self._own(component)
+        if self._tree._parent[index] != self._index:
+            raise ValueError(f"{component!r}는 이 컴포넌트의 자식이 아닙니다.")
+        self._tree._detach(index)
+
+    def is_composite(self) -> bool:
+        return True
+
+    def children(self) -> Sequence[Component]:
+        view = self._tree.view
+        return [view(index) for index in self._tree.child_indices(self._index)]
+
+    def operation(self) -> str:
+        return fold(self, _aggregate)
+
+
+
+def _aggregate(node: Component, results: List[str]) -> str:
+    if node.is_composite():
+        return f"Branch({'+'.join(results)})"
+    return node.operation()
+
+
+
+def benchmark_memory(nodes: int = 1_000_000, fanout: int = 10) -> dict:
+    """
+    같은 모양의 트리를 객체로 만들 때와 CompactTree로 만들 때의 메모리 사용량을 tracemalloc으로 재고,
+    노드 백만 개당 바이트 수로 환산합니다.
+    """
+
+    def build(make_composite, make_leaf) -> Component:
+        # 너비 우선으로 채워서 리프 비율이 fanout에 맞는 트리를 만듭니다.
+        root = make_composite()
+        frontier = [root]
+        created = 1
+        while created < nodes:
+            next_frontier = []
+            for parent in frontier:
+                for _ in range(fanout):
+                    if created >= nodes:
+                        break
+                    child = make_composite() if created * fanout < nodes else make_leaf()
+                    parent.add(child)
+                    next_frontier.append(child)
+                    created += 1
+            frontier = next_frontier
+        return root
+
+    results = {}
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        objects = build(Composite, Leaf)
+        results["object_seconds"] = time.perf_counter() - start
+        results["object_bytes_per_million"] = (tracemalloc.get_traced_memory()[0] - before) * 1_000_000 // nodes
+        # 부모와 자식이 서로를 참조하므로 순환 참조 수집기로 해제해야 합니다.
+        del objects
+        gc.collect()
+
+        before = tracemalloc.get_traced_memory()[0]
+        tree = CompactTree()
+        start = time.perf_counter()
+        build(tree.composite, tree.leaf)
+        results["compact_seconds"] = time.perf_counter() - start
+        gc.collect()
+        results["compact_bytes_per_million"] = (tracemalloc.get_traced_memory()[0] - before) * 1_000_000 // nodes
+        results["compact_array_bytes_per_million"] = tree.nbytes * 1_000_000 // len(tree)
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+
+if __name__ == "__main__":
+    # 클라이언트 코드: composite.py와 같은 트리를 배열 기반 저장소로 만듭니다.
+    tree = CompactTree()
+    root = tree.composite()
+
+    branch1 = tree.composite()
+    branch1.add(tree.leaf())
+    branch1.add(tree.leaf())
+
+    branch2 = tree.composite()
+    branch2.add(tree.leaf())
+
+    root.add(branch1)
+    root.add(branch2)
+    print(f"결과: {root.operation()}")
+
+    leaf = tree.leaf()
+    root.add(leaf)
+    print(f"결과: {root.operation()}")
+    root.remove(leaf)
+    print(f"결과: {root.operation()}")
+    print(f"노드 {len(tree)}개가 {tree.nbytes}바이트를 차지합니다.")
+
+    if "--bench" in sys.argv[1:]:
+        print(benchmark_memory())
+
+# python structural_pattern/compact_composite.py
@@ -1,6 +1,10 @@
 from __future__ import annotations
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
 
 
@@ -9,6 +13,13 @@ class Component(ABC):
     기본 Component 클래스는 단순 및 복합 객체의 공통 작업을 선언합니다.
     """
 
+    __slots__ = ()
+    """
+    `__slots__`를 선언한 하위 클래스(예: compact_composite.py의 뷰)가 `__dict__` 없이 만들어질 수 있도록 비워 둡니다.
+    """
+
+    _parent: Component = None
+
     @property
     def parent(self) -> Component:
         return self._parent
@@ -21,6 +32,15 @@ class Component(ABC):
         이 메서드에 대한 기본 구현을 제공할 수도 있습니다.
         """
         self._parent = parent
+
+    def __getstate__(self) -> dict:
+        """
+        부모 링크는 피클에 담지 않습니다. 하위 트리 하나만 직렬화해도 트리 전체가 딸려 가지 않으며,
+        복원할 때 Composite가 자식들의 부모를 다시 연결합니다.
+        """
+        state = dict(self.__dict__)
+        state.pop("_parent", None)
+        return state
     
     """
     어떤 경우에는 자식 관리 작업을 기본 Component 클래스에 정의하는 것이 유리할 수 있습니다.
@@ -40,6 +60,27 @@ class Component(ABC):
         클라이언트 코드가 컴포넌트가 자식을 가질 수 있는지 여부를 확인할 수 있도록 하는 메서드를 제공합니다.
         """
         return False
+
+    def children(self) -> Sequence[Component]:
+        """
+        자식 컴포넌트들을 순서대로 반환합니다. 리프는 자식이 없습니다.
+        """
+        return ()
+
+    def invalidate(self) -> None:
+        """
+        이 컴포넌트의 결과가 바뀌었음을 조상들에게 알려 캐시된 결과를 버리게 합니다.
+        이미 무효화된 조상을 만나면 그 위의 조상들도 무효화된 상태이므로 멈춥니다. 비용은 O(깊이)입니다.
+        """
+        node = self._parent
+        while node is not None and node._drop_cache():
+            node = node._parent
+
+    def _drop_cache(self) -> bool:
+        """
+        캐시된 결과가 있었으면 버리고 참을 반환합니다.
+        """
+        return False
     
     @abstractmethod
     def operation(self) -> str:
@@ -70,22 +111,91 @@ class Composite(Component):
     """
 
     def __init__(self) -> None:
-        self._children: List[Component] = []
+        self._children: Dict[Component, None] = {}
+        """
+        자식들은 삽입 순서를 유지하는 사전의 키로 보관합니다.
+        리스트와 달리 추가, 제거, 포함 여부 확인이 모두 O(1)이므로 자식이 아주 많은 복합 객체에서도 빠릅니다.
+        같은 컴포넌트를 두 번 추가하면 처음 위치에 한 번만 남습니다.
+        """
+        self._cached: Optional[str] = None
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        for child in self._children:
+            child._parent = self
 
     """
     복합 객체는 자식 목록에 다른 컴포넌트(단순 또는 복합)를 추가하거나 제거할 수 있습니다.
     """
 
     def add(self, component: Component) -> None:
-        self._children.append(component)
+        """
+        다른 복합 객체에 속해 있던 컴포넌트는 먼저 그곳에서 떼어 냅니다.
+        그래야 이전 부모와 그 조상들의 캐시도 무효화되고, 한 컴포넌트가 두 부모의 자식 목록에 남지 않습니다.
+        """
+        self._adopt(component)
+        self._children[component] = None
         component.parent = self
+        component.invalidate()
+
+    def _adopt(self, component: Component) -> None:
+        previous = component.parent
+        if previous is not None and previous is not self:
+            previous.remove(component)
     
     def remove(self, component: Component) -> None:
-        self._children.remove(component)
+        try:
+            del self._children[component]
+        except KeyError:
+            raise ValueError(f"{component!r}는 이 컴포넌트의 자식이 아닙니다.") from None
+        component.invalidate()
         component.parent = None
 
+    def add_many(self, components: Iterable[Component]) -> None:
+        """
+        여러 자식을 한 번에 추가합니다. 조상들의 캐시는 자식마다가 아니라 한 번만 무효화합니다.
+        """
+        children = self._children
+        for component in components:
+            self._adopt(component)
+            children[component] = None
+            component.parent = self
+        if self._drop_cache():
+            self.invalidate()
+
+    def remove_many(self, components: Iterable[Component]) -> None:
+        """
+        여러 자식을 한 번에 제거합니다. 자식이 아닌 컴포넌트가 섞여 있으면 아무것도 제거하지 않고 ValueError를 발생시킵니다.
+        """
+        components = list(components)
+        children = self._children
+        for component in components:
+            if component not in children:
+                raise ValueError(f"{component!r}는 이 컴포넌트의 자식이 아닙니다.")
+        for component in components:
+            children.pop(component, None)
+            component.parent = None
+        if self._drop_cache():
+            self.invalidate()
+
+    def __contains__(self, component: Component) -> bool:
+        return component in self._children
+
+    def _drop_cache(self) -> bool:
+        if self._cached is None:
+            return False
+        self._cached = None
+        return True
+
     def is_composite(self) -> bool:
         return True
+
+    def children(self) -> Sequence[Component]:
+        """
+        자식들의 목록을 새 리스트로 반환합니다. 순회 엔진이 `reversed()`로 거꾸로 쌓을 수 있어야 하는데,
+        사전의 키 뷰는 Python 3.8부터만 `reversed()`를 지원합니다.
+        """
+        return list(self._children)
     
     def operation(self) -> str:
         """
@@ -93,12 +203,226 @@ class Composite(Component):
         자식들은 재귀적으로 순회하면서 그들의 결과를 수집하고 합산합니다.
         Composite의 자식들이 이 호출을 그들의 자식들에게 전달하므로,
         결과적으로 전체 객체 트리가 순회됩니다.
+
+        트리는 쓰기보다 읽기가 훨씬 잦으므로, 합산한 결과를 캐시해 두고 하위 트리가 바뀔 때만 다시 계산합니다.
+        재귀 호출 대신 명시적 스택을 쓰는 `fold`로 순회하므로 아주 깊은 트리에서도 RecursionError가 나지 않습니다.
+        `operation`을 재정의한 하위 컴포넌트는 순회에 펼치지 않고 그 메서드를 호출합니다.
         """
 
-        results = []
-        for child in self._children:
-            results.append(child.operation())
-        return f"Branch({'+'.join(results)})"
+        if self._cached is None:
+            # 하위 클래스가 `super().operation()`을 호출한 경우 자기 자신의 재정의를 다시 부르지 않도록 루트는 건너뜁니다.
+            self._cached = fold(self, _aggregate, prune=lambda node: None if node is self else _known_result(node))
+        return self._cached
+
+
+
+T = TypeVar("T")
+
+
+def walk(root: Component, order: str = "preorder") -> Iterator[Component]:
+    """
+    트리의 컴포넌트들을 재귀 없이 순회합니다.
+    `order`는 "preorder"(전위), "postorder"(후위), "breadth"(너비 우선) 중 하나입니다.
+    """
+    if order == "preorder":
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children()))
+    elif order == "postorder":
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                yield node
+                continue
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(node.children()))
+    elif order == "breadth":
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            yield node
+            queue.extend(node.children())
+    else:
+        raise ValueError(f"알 수 없는 순회 순서입니다: {order}")
+
+
+
+def fold(
+        root: Component, visit: Callable[[Component, List[T]], T],
+        prune: Optional[Callable[[Component], Optional[T]]] = None
+) -> T:
+    """
+    트리를 후위 순서로 접어(fold) 하나의 값으로 만듭니다.
+
+    각 컴포넌트마다 `visit(컴포넌트, 자식들의 결과 리스트)`를 호출하며, 자식 결과는 자식 순서를 따릅니다.
+    `prune`이 None이 아닌 값을 반환하면 그 값을 해당 하위 트리의 결과로 사용하고 내려가지 않습니다.
+    재귀 대신 명시적 스택을 사용하므로 트리의 깊이에 제한이 없습니다.
+    """
+    results: List[T] = []
+    # 펼친 컴포넌트는 자식 수와 함께 다시 쌓아 두어, 결과를 모을 때 자식 목록을 다시 만들지 않습니다.
+    stack = [(root, -1)]
+    while stack:
+        node, count = stack.pop()
+        if count >= 0:
+            child_results = results[len(results) - count:]
+            del results[len(results) - count:]
+            results.append(visit(node, child_results))
+            continue
+        if prune is not None:
+            value = prune(node)
+            if value is not None:
+                results.append(value)
+                continue
+        children = node.children()
+        if children:
+            stack.append((node, len(children)))
+            stack.extend((child, -1) for child in reversed(children))
+        else:
+            results.append(visit(node, []))
+    return results[0]
+
+
+
+def _is_default_composite(node: Component) -> bool:
+    """
+    `operation`을 재정의하지 않아 순회 엔진이 대신 펼쳐서 계산해도 되는 Composite인지 확인합니다.
+    """
+    return isinstance(node, Composite) and type(node).operation is Composite.operation
+
+
+
+def _known_result(node: Component) -> Optional[str]:
+    """
+    하위 트리로 내려가지 않고 알 수 있는 결과를 반환합니다.
+    캐시된 Composite는 캐시를, `operation`을 재정의한 Composite는 그 메서드의 결과를 사용합니다.
+    """
+    if not isinstance(node, Composite):
+        return None
+    if type(node).operation is not Composite.operation:
+        return node.operation()
+    return node._cached
+
+
+
+def _aggregate(node: Component, results: List[str]) -> str:
+    if isinstance(node, Composite):
+        node._cached = f"Branch({'+'.join(results)})"
+        return node._cached
+    return node.operation()
+
+
+
+def evaluate_parallel(
+        root: Component, workers: int = 4, processes: bool = False, pool: Optional[Executor] = None,
+        min_subtree: int = 1_000, chunks_per_worker: int = 4
+) -> str:
+    """
+    `root.operation()`과 같은 결과를 여러 작업자에 나누어 계산하는 선택적 평가 방식입니다.
+    리프의 작업이 비싸고 서로 독립적일 때 사용합니다.
+
+    먼저 하위 트리의 크기를 세고, 트리를 위에서부터 펼치면서 이웃한 형제 하위 트리들을
+    대략 `전체 크기 / (workers * chunks_per_worker)`개 노드씩 묶어 작업으로 만듭니다(크기 기반 분할).
+    작업 수를 작업자 수보다 넉넉히 두어 일찍 끝난 작업자가 남은 작업을 가져가게 합니다.
+    작업 결과는 자식 순서대로 다시 합쳐지고, 계산된 결과는 평소처럼 캐시됩니다.
+    트리가 `min_subtree`보다 작거나 작업자가 하나뿐이면 그냥 순차적으로 계산합니다.
+
+    `processes=True`이면 프로세스 풀을 사용합니다. 이때 하위 트리는 피클로 전달되므로 리프 클래스는
+    모듈 최상위에 정의되어 있어야 합니다. CPU를 쓰는 리프는 GIL 때문에 프로세스 풀에서만 빨라지고,
+    I/O를 기다리는 리프는 스레드 풀로도 충분합니다. `pool`을 넘기면 그 실행기를 재사용합니다.
+    """
+    if not _is_default_composite(root) or root._cached is not None:
+        return root.operation()
+    sizes = _subtree_sizes(root)
+    total = sizes[id(root)]
+    if workers <= 1 or total < min_subtree:
+        return root.operation()
+
+    target = max(min_subtree, total // (workers * chunks_per_worker))
+    batches: List[List[Component]] = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        batch, batch_size = [], 0
+        for child in node.children():
+            size = sizes[id(child)]
+            # `operation`을 재정의한 Composite는 그 메서드가 하위 트리 전체를 계산하므로 나누지 않습니다.
+            if size > target and _is_default_composite(child):
+                stack.append(child)
+                continue
+            batch.append(child)
+            batch_size += size
+            if batch_size >= target:
+                batches.append(batch)
+                batch, batch_size = [], 0
+        if batch:
+            batches.append(batch)
+
+    owned = pool is None
+    if owned:
+        pool = (ProcessPoolExecutor if processes else ThreadPoolExecutor)(max_workers=workers)
+    # 다른 프로세스에서 계산한 캐시는 이 프로세스의 객체에 남지 않으므로 결과와 함께 돌려받아 다시 써 넣습니다.
+    # 캐시된 조상 아래에 캐시되지 않은 복합 객체가 남으면 `invalidate`가 중간에 멈춰 오래된 결과가 보이게 됩니다.
+    remote = isinstance(pool, ProcessPoolExecutor)
+    try:
+        futures = [pool.submit(_evaluate_batch, batch, remote) for batch in batches]
+        done = {}
+        for batch, future in zip(batches, futures):
+            for node, (result, caches) in zip(batch, future.result()):
+                done[id(node)] = result
+                if remote:
+                    for composite, cached in zip(_composites(node), caches):
+                        composite._cached = cached
+    finally:
+        if owned:
+            pool.shutdown()
+
+    def known_result(node: Component) -> Optional[str]:
+        result = done.get(id(node))
+        return result if result is not None else _known_result(node)
+
+    return fold(root, _aggregate, prune=known_result)
+
+
+
+def _subtree_sizes(root: Component) -> Dict[int, int]:
+    """
+    각 하위 트리의 노드 수를 `id(컴포넌트)`를 키로 반환합니다. 캐시된 복합 객체는 다시 계산할 필요가 없으므로 1로 셉니다.
+    """
+    sizes: Dict[int, int] = {}
+
+    def count(node: Component, counts: List[int]) -> int:
+        sizes[id(node)] = size = 1 + sum(counts)
+        return size
+
+    def cached(node: Component) -> Optional[int]:
+        if not _is_default_composite(node) or node._cached is None:
+            return None
+        sizes[id(node)] = 1
+        return 1
+
+    fold(root, count, prune=cached)
+    return sizes
+
+
+
+def _evaluate_batch(nodes: List[Component], with_caches: bool = False) -> List[Tuple[str, List[str]]]:
+    """
+    각 하위 트리의 결과와, `with_caches`이면 그 안의 복합 객체들의 캐시를 전위 순서로 반환합니다.
+    """
+    evaluated = []
+    for node in nodes:
+        result = fold(node, _aggregate, prune=_known_result)
+        caches = [composite._cached for composite in _composites(node)] if with_caches else []
+        evaluated.append((result, caches))
+    return evaluated
+
+
+
+def _composites(root: Component) -> Iterator[Composite]:
+    return (node for node in walk(root) if isinstance(node, Composite))
 
 
 
@@ -123,6 +447,154 @@ def client_code2(component1: Component, component2: Component) -> None:
 
 
 
+def benchmark_traversal(depth: int = 100_000, fanout: int = 10, levels: int = 5) -> dict:
+    """
+    재귀 순회와 `fold`의 노드당 비용을 넓은 트리에서 비교하고, 재귀로는 불가능한 깊이의 트리를 접어 봅니다.
+    """
+
+    def count_recursive(node: Component) -> int:
+        return 1 + sum(count_recursive(child) for child in node.children())
+
+    def build(level: int) -> Component:
+        if level == 0:
+            return Leaf()
+        node = Composite()
+        for _ in range(fanout):
+            node.add(build(level - 1))
+        return node
+
+    wide = build(levels)
+    results = {}
+    start = time.perf_counter()
+    nodes = count_recursive(wide)
+    results["recursive_ns_per_node"] = (time.perf_counter() - start) / nodes * 1e9
+    start = time.perf_counter()
+    fold(wide, lambda node, counts: 1 + sum(counts))
+    results["fold_ns_per_node"] = (time.perf_counter() - start) / nodes * 1e9
+
+    deep = Composite()
+    node = deep
+    for _ in range(depth):
+        child = Composite()
+        node.add(child)
+        node = child
+    start = time.perf_counter()
+    results["deep_depth"] = fold(deep, lambda node, depths: 1 + max(depths, default=0))
+    results["deep_seconds"] = time.perf_counter() - start
+    return results
+
+
+
+def benchmark_children(width: int = 20_000, depth: int = 10_000) -> dict:
+    """
+    넓은 트리에서 자식을 하나씩 제거하는 비용을 리스트 기반 자식 목록과 비교하고,
+    깊은 트리에서 캐시된 결과를 무효화하며 자식을 붙였다 떼는 비용을 잽니다.
+    """
+
+    class ListComposite(Composite):
+        def __init__(self) -> None:
+            super().__init__()
+            self._children = []
+
+        def add(self, component: Component) -> None:
+            self._children.append(component)
+            component.parent = self
+            component.invalidate()
+
+        def remove(self, component: Component) -> None:
+            self._children.remove(component)
+            component.invalidate()
+            component.parent = None
+
+        def children(self) -> Sequence[Component]:
+            return self._children
+
+    results = {}
+    for cls in (ListComposite, Composite):
+        root = cls()
+        leaves = [Leaf() for _ in range(width)]
+        for leaf in leaves:
+            root.add(leaf)
+        root.operation()
+        start = time.perf_counter()
+        # 뒤에서부터 제거하면 리스트는 매번 전체를 훑어야 합니다.
+        for leaf in reversed(leaves):
+            root.remove(leaf)
+        results[f"{cls.__name__}_remove_seconds"] = time.perf_counter() - start
+
+    root = Composite()
+    leaves = [Leaf() for _ in range(width)]
+    start = time.perf_counter()
+    root.add_many(leaves)
+    root.remove_many(leaves)
+    results["bulk_add_remove_seconds"] = time.perf_counter() - start
+
+    root = node = Composite()
+    for _ in range(depth):
+        child = Composite()
+        node.add(child)
+        node = child
+    leaf = Leaf()
+    elapsed = 0.0
+    for _ in range(10):
+        root.operation()
+        start = time.perf_counter()
+        node.add(leaf)
+        node.remove(leaf)
+        elapsed += time.perf_counter() - start
+    results["deep_add_remove_seconds"] = elapsed / 10
+    return results
+
+
+
+class BusyLeaf(Leaf):
+    """
+    결과를 내기 전에 CPU를 쓰는 계산을 하는 리프입니다. 병렬 평가의 벤치마크에 사용합니다.
+    """
+
+    def __init__(self, work: int = 2_000) -> None:
+        self.work = work
+
+    def operation(self) -> str:
+        sum(i * i for i in range(self.work))
+        return "Leaf"
+
+
+
+def benchmark_parallel(branches: int = 16, leaves: int = 500, worker_counts=(1, 2, 4, 8, 16)) -> dict:
+    """
+    CPU를 쓰는 리프로 이루어진 트리를 순차 평가와 스레드/프로세스 풀 병렬 평가로 계산한 시간을 비교합니다.
+    실행할 때마다 캐시를 비운 같은 트리를 사용합니다.
+    """
+    root = Composite()
+    for _ in range(branches):
+        branch = Composite()
+        branch.add_many(BusyLeaf() for _ in range(leaves))
+        root.add(branch)
+
+    def clear() -> None:
+        for node in walk(root):
+            node._drop_cache()
+
+    clear()
+    start = time.perf_counter()
+    expected = root.operation()
+    results = {"serial_seconds": time.perf_counter() - start}
+    for processes in (False, True):
+        kind = "processes" if processes else "threads"
+        for workers in worker_counts:
+            with (ProcessPoolExecutor if processes else ThreadPoolExecutor)(max_workers=workers) as pool:
+                # 작업자를 미리 띄워 두어 시작 비용이 측정에 섞이지 않게 합니다.
+                list(pool.map(abs, range(workers)))
+                clear()
+                start = time.perf_counter()
+                result = evaluate_parallel(root, workers=workers, processes=processes, pool=pool)
+                results[f"{kind}_{workers}_seconds"] = time.perf_counter() - start
+            assert result == expected
+    return results
+
+
+
 if __name__ == "__main__":
     # 이렇게 하면 클라이언트 코드는 단순한 리프 컴포넌트를 지원할 수 있습니다.
     simple = Leaf()
@@ -149,5 +621,38 @@ if __name__ == "__main__":
 
     print("클라이언트: 트리를 관리할 때 컴포넌트 클래스를 확인할 필요가 없습니다:")
     client_code2(tree, simple)
+    print("\n")
+
+    # 순회 엔진은 재귀 없이 여러 순서로 트리를 방문합니다.
+    for order in ("preorder", "postorder", "breadth"):
+        names = ["B" if node.is_composite() else "L" for node in walk(tree, order)]
+        print(f"클라이언트: {order} 순회: {' '.join(names)}")
+    leaves = fold(tree, lambda node, counts: sum(counts) if node.is_composite() else 1)
+    print(f"클라이언트: 트리에는 리프가 {leaves}개 있습니다.")
+
+    # 프로세스 풀로 병렬 평가한 뒤 작업 안쪽의 노드를 바꿔도 캐시가 올바르게 무효화되어야 합니다.
+    big = Composite()
+    inner = None
+    for _ in range(8):
+        branch = Composite()
+        for _ in range(3):
+            inner = Composite()
+            inner.add_many(Leaf() for _ in range(10))
+            branch.add(inner)
+        big.add(branch)
+    evaluate_parallel(big, workers=2, processes=True, min_subtree=10)
+    inner.add(Leaf())
+    # `_aggregate`는 캐시를 채우므로, 비교할 값은 캐시를 건드리지 않고 처음부터 계산합니다.
+    expected = fold(big, lambda node, results: f"Branch({'+'.join(results)})" if node.is_composite() else node.operation())
+    if big.operation() == expected:
+        print("클라이언트: 병렬 평가 후 수정한 내용이 결과에 반영됩니다.", end="")
+    else:
+        print("클라이언트: 병렬 평가 후 오래된 결과가 남았습니다.", end="")
+
+    if "--bench" in sys.argv[1:]:
+        print("\n")
+        print(benchmark_traversal())
+        print(benchmark_children())
+        print(benchmark_parallel())
 
 # python structural_pattern/composite.py
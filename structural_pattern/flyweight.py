@@ -1,5 +1,12 @@
 import json
-from typing import Dict
+import sys
+import time
+import weakref
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from threading import Lock, Thread
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 
 
@@ -15,6 +22,277 @@ class Flyweight:
     def operation(self, unique_state: str) -> None:
         print(f"플라이웨이트: 공유상태 ({json.dumps(self._shared_state)}와 고유상태 ({json.dumps(unique_state)})를 표시 중.)", end="")
 
+    def operation_batch(self, unique_states: Iterable[Sequence[str]]) -> None:
+        """
+        여러 엔터티의 고유 상태를 한 번에 처리합니다.
+        공유 상태는 한 번만 직렬화하고 결과는 한 번에 출력합니다.
+        """
+        shared = json.dumps(self._shared_state)
+        print("".join(
+            f"플라이웨이트: 공유상태 ({shared}와 고유상태 ({json.dumps(list(state))})를 표시 중.)\n"
+            for state in unique_states
+        ), end="")
+
+
+
+def sizeof_flyweight(flyweight: Flyweight) -> int:
+    """
+    플라이웨이트 하나가 메모리에 차지하는 대략적인 바이트 수를 반환합니다.
+    객체 자신, 속성 사전, 공유 상태 컨테이너와 그 원소들을 합산합니다.
+    """
+    state = flyweight._shared_state
+    size = sys.getsizeof(flyweight) + sys.getsizeof(flyweight.__dict__) + sys.getsizeof(state)
+    if isinstance(state, (list, tuple)):
+        size += sum(sys.getsizeof(item) for item in state)
+    return size
+
+
+
+class EvictionPolicy(ABC):
+    """
+    제거 정책은 풀이 가득 찼을 때 어떤 플라이웨이트를 내보낼지 결정합니다.
+    풀은 키가 조회되거나 추가되거나 제거될 때마다 정책에 알려줍니다.
+    """
+
+    weak: bool = False
+    """
+    참이면 풀은 플라이웨이트를 약한 참조로만 보관합니다.
+    """
+
+    @abstractmethod
+    def touch(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def insert(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def discard(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def victim(self) -> str:
+        pass
+
+
+
+class LRUEviction(EvictionPolicy):
+    """
+    가장 오랫동안 사용되지 않은 플라이웨이트를 먼저 내보냅니다.
+    """
+
+    def __init__(self) -> None:
+        self._order: "OrderedDict[str, None]" = OrderedDict()
+
+    def touch(self, key: str) -> None:
+        self._order.move_to_end(key)
+
+    def insert(self, key: str) -> None:
+        self._order[key] = None
+
+    def discard(self, key: str) -> None:
+        self._order.pop(key, None)
+
+    def victim(self) -> str:
+        return next(iter(self._order))
+
+
+
+class LFUEviction(EvictionPolicy):
+    """
+    가장 적게 사용된 플라이웨이트를 먼저 내보냅니다.
+    사용 횟수가 같으면 그중 가장 오래된 것을 내보냅니다.
+
+    빈도별 버킷을 빈도 순서대로 이중 연결 리스트로 잇습니다. 사용 횟수는 1씩만 늘어나므로 새 버킷은 항상
+    이전 버킷 바로 뒤에 들어가고, 가장 작은 빈도는 리스트의 머리입니다. 따라서 모든 연산이 O(1)입니다.
+    """
+
+    def __init__(self) -> None:
+        self._freq: Dict[str, int] = {}
+        self._buckets: Dict[int, "OrderedDict[str, None]"] = {}
+        self._lower: Dict[int, Optional[int]] = {}
+        self._higher: Dict[int, Optional[int]] = {}
+        self._head: Optional[int] = None
+
+    def _link(self, freq: int, after: Optional[int]) -> None:
+        # `after` 바로 뒤(`after`가 None이면 머리)에 빈 버킷을 만듭니다.
+        higher = self._head if after is None else self._higher[after]
+        self._buckets[freq] = OrderedDict()
+        self._lower[freq] = after
+        self._higher[freq] = higher
+        if after is None:
+            self._head = freq
+        else:
+            self._higher[after] = freq
+        if higher is not None:
+            self._lower[higher] = freq
+
+    def _unlink(self, freq: int) -> None:
+        lower, higher = self._lower.pop(freq), self._higher.pop(freq)
+        del self._buckets[freq]
+        if lower is None:
+            self._head = higher
+        else:
+            self._higher[lower] = higher
+        if higher is not None:
+            self._lower[higher] = lower
+
+    def _remove_from(self, key: str, freq: int) -> None:
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            self._unlink(freq)
+
+    def touch(self, key: str) -> None:
+        freq = self._freq[key]
+        if freq + 1 not in self._buckets:
+            self._link(freq + 1, freq)
+        self._buckets[freq + 1][key] = None
+        self._freq[key] = freq + 1
+        self._remove_from(key, freq)
+
+    def insert(self, key: str) -> None:
+        if 1 not in self._buckets:
+            self._link(1, None)
+        self._freq[key] = 1
+        self._buckets[1][key] = None
+
+    def discard(self, key: str) -> None:
+        freq = self._freq.pop(key, None)
+        if freq is not None:
+            self._remove_from(key, freq)
+
+    def victim(self) -> str:
+        if self._head is None:
+            raise LookupError("내보낼 플라이웨이트가 없습니다.")
+        return next(iter(self._buckets[self._head]))
+
+
+
+class WeakRefEviction(EvictionPolicy):
+    """
+    어떤 엔터티도 더 이상 플라이웨이트를 참조하지 않으면 풀에서 사라지게 합니다.
+    용량 기반 제거는 하지 않으므로 풀의 `capacity`는 무시됩니다.
+    """
+
+    weak = True
+
+    def touch(self, key: str) -> None:
+        pass
+
+    def insert(self, key: str) -> None:
+        pass
+
+    def discard(self, key: str) -> None:
+        pass
+
+    def victim(self) -> str:
+        raise LookupError("WeakRefEviction은 용량 기반 제거를 하지 않습니다.")
+
+
+
+class PoolStats:
+    """
+    풀의 적중, 실패, 제거 횟수와 상주 바이트 수를 기록합니다.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.resident_bytes = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "resident_bytes": self.resident_bytes,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+
+class FlyweightPool:
+    """
+    용량이 제한된 플라이웨이트 저장소입니다.
+    팩토리는 사전 대신 이 풀을 사용할 수 있으며, 풀은 가득 차면 제거 정책에 따라 항목을 내보냅니다.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, policy: Optional[EvictionPolicy] = None) -> None:
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+        self._capacity = capacity
+        self._policy = policy if policy is not None else LRUEviction()
+        self._items = weakref.WeakValueDictionary() if self._policy.weak else {}
+        self._sizes: Dict[str, int] = {}
+        self._finalizers: Dict[str, weakref.finalize] = {}
+        self.stats = PoolStats()
+
+    @property
+    def weak(self) -> bool:
+        """
+        참조가 없어진 항목을 내보내는 약한 참조 풀인지 여부입니다.
+        """
+        return self._policy.weak
+
+    def get(self, key: str) -> Optional[Flyweight]:
+        flyweight = self._items.get(key)
+        if flyweight is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+            self._policy.touch(key)
+        return flyweight
+
+    def __setitem__(self, key: str, flyweight: Flyweight) -> None:
+        if key in self._items:
+            self._remove(key)
+        elif self._capacity is not None and not self._policy.weak:
+            while len(self._items) >= self._capacity:
+                self._remove(self._policy.victim())
+                self.stats.evictions += 1
+
+        size = sizeof_flyweight(flyweight)
+        self._items[key] = flyweight
+        self._sizes[key] = size
+        self.stats.resident_bytes += size
+        self._policy.insert(key)
+        if self._policy.weak:
+            self._finalizers[key] = weakref.finalize(flyweight, self._collected, key)
+
+    def __getitem__(self, key: str) -> Flyweight:
+        return self._items[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def keys(self) -> Iterator[str]:
+        return iter(list(self._items.keys()))
+
+    def _remove(self, key: str) -> None:
+        del self._items[key]
+        self.stats.resident_bytes -= self._sizes.pop(key)
+        self._policy.discard(key)
+        finalizer = self._finalizers.pop(key, None)
+        if finalizer is not None:
+            finalizer.detach()
+
+    def _collected(self, key: str) -> None:
+        # 마지막 강한 참조가 사라져 약한 참조 사전에서 항목이 지워졌을 때 호출됩니다.
+        self._finalizers.pop(key, None)
+        self.stats.resident_bytes -= self._sizes.pop(key)
+        self.stats.evictions += 1
+
 
 
 class FlyweightFactory:
@@ -23,34 +301,65 @@ class FlyweightFactory:
     플라이웨이트가 적절히 공유되도록 보장합니다.
     클라이언트가 플라이웨이트를 요청할 때, 팩토리는 기존 인스턴스를 반환하거나,
     아직 존재하지 않으면 새 인스턴스를 생성하여 반환합니다.
+
+    `pool`을 전달하면 팩토리는 모든 인스턴스가 공유하는 사전 대신 용량이 제한된 풀을 사용합니다.
+    `verbose`가 거짓이면 조회마다 출력하는 메시지를 생략합니다.
+    약한 참조 풀(`WeakRefEviction`)에서는 미리 적재한 플라이웨이트를 팩토리가 강하게 참조하여
+    팩토리가 살아 있는 동안 풀에 남아 있게 합니다. 조회 중에 만들어진 플라이웨이트만 참조가 없어지면 사라집니다.
     """
 
     _flyweights: Dict[str, Flyweight] = {}
 
-    def __init__(self, initial_flyweights: Dict) -> None:
+    def __init__(self, initial_flyweights: Dict, pool: Optional[FlyweightPool] = None, verbose: bool = True) -> None:
+        self._verbose = verbose
+        if pool is not None:
+            self._flyweights = pool
+        self._pinned: List[Flyweight] = []
+        pin = getattr(self._flyweights, "weak", False)
         for state in initial_flyweights:
-            self._flyweights[self.get_key(state)] = Flyweight(state)
+            flyweight = Flyweight(state)
+            self._flyweights[self.get_key(state)] = flyweight
+            if pin:
+                self._pinned.append(flyweight)
+
+    @property
+    def stats(self) -> Optional[PoolStats]:
+        """
+        풀 모드일 때 풀의 통계를 반환합니다.
+        """
+        return getattr(self._flyweights, "stats", None)
+
+    def _log(self, message: str) -> None:
+        if self._verbose:
+            print(message)
 
     def get_key(self, state: Dict) -> str:
         """
         주어진 상태에 대한 플라이웨이트의 문자열 해시를 반환합니다.
         """
         return "_".join(sorted(state))
-    
+
     def get_flyweight(self, shared_state: Dict) -> Flyweight:
         """
         주어진 상태로 기존 플라이웨이트를 반환하거나 새로 생성합니다.
         """
         key = self.get_key(shared_state)
 
-        if not self._flyweights.get(key):
-            print("FlyweightFactory: 플라이웨이트를 찾을 수 없습니다. 새로 생성 중")
-            self._flyweights[key] = Flyweight(shared_state)
+        # 약한 참조 풀에서는 저장 직후 사라질 수 있으므로 지역 변수로 붙잡아 둡니다.
+        flyweight = self._flyweights.get(key)
+        if not flyweight:
+            flyweight = self._create(key, shared_state)
         else:
-            print("FlyweightFactory: 기존 플라이웨이트 재사용 중.")
-        
-        return self._flyweights[key]
-    
+            self._log("FlyweightFactory: 기존 플라이웨이트 재사용 중.")
+
+        return flyweight
+
+    def _create(self, key: Union[str, int], shared_state: Dict) -> Flyweight:
+        self._log("FlyweightFactory: 플라이웨이트를 찾을 수 없습니다. 새로 생성 중")
+        flyweight = Flyweight(shared_state)
+        self._flyweights[key] = flyweight
+        return flyweight
+
     def list_flyweights(self) -> None:
         count = len(self._flyweights)
         print(f"FlyweightFactory: {count}개의 플라이웨이트가 있습니다:")
@@ -58,6 +367,199 @@ class FlyweightFactory:
 
 
 
+class KeyInterner:
+    """
+    공유 상태 튜플을 작은 정수 ID로 매핑하는 인턴 테이블입니다.
+
+    처음 보는 상태만 정렬하여 정규형을 만들고, 정규형 테이블(해시 컨싱)에서 ID를 찾습니다.
+    이후 같은 상태가 다시 들어오면 튜플 해시 한 번으로 ID를 돌려주므로 정렬이나 문자열 생성이 없습니다.
+    `state`는 각 ID에 처음 등록된 순서 그대로의 상태를 돌려줍니다.
+
+    ID는 `CarStore`처럼 외부 배열에 저장되어 언제든 다시 상태로 바꿀 수 있어야 하므로 해제하지 않습니다.
+    따라서 테이블은 지금까지 본 서로 다른 상태의 수만큼 계속 자랍니다.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[Tuple[str, ...], int] = {}
+        self._canonical: Dict[Tuple[str, ...], int] = {}
+        self._states: List[Tuple[str, ...]] = []
+
+    def intern(self, state: Sequence[str]) -> int:
+        if type(state) is not tuple:
+            state = tuple(state)
+        ident = self._ids.get(state)
+        if ident is None:
+            ident = self._intern_slow(state)
+        return ident
+
+    def _intern_slow(self, state: Tuple[str, ...]) -> int:
+        canonical = tuple(sorted(state))
+        ident = self._canonical.get(canonical)
+        if ident is None:
+            ident = len(self._states)
+            self._states.append(state)
+            self._canonical[canonical] = ident
+        self._ids[state] = ident
+        return ident
+
+    def state(self, ident: int) -> Tuple[str, ...]:
+        return self._states[ident]
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+
+class InternedFlyweightFactory(FlyweightFactory):
+    """
+    문자열 키 대신 인턴된 정수 ID로 플라이웨이트를 찾는 팩토리입니다.
+    클라이언트가 공유 상태를 튜플로 넘기면 반복 조회 시 추가 할당이 없습니다.
+
+    용량이 제한된 `FlyweightPool`과 함께 쓰면 플라이웨이트 수는 제한되지만, 인터너는 제거된 상태의 ID도
+    계속 보관하므로 메모리가 서로 다른 상태의 수에 비례해 늘어납니다. 상태의 종류가 한없이 늘어나는 경우에는
+    이 팩토리 대신 문자열 키를 쓰는 `FlyweightFactory`와 풀을 사용해야 합니다.
+    """
+
+    def __init__(
+            self, initial_flyweights: Dict, pool: Optional[FlyweightPool] = None,
+            verbose: bool = True, interner: Optional[KeyInterner] = None
+    ) -> None:
+        self._interner = interner if interner is not None else KeyInterner()
+        # 정수 키가 다른 팩토리의 문자열 키와 섞이지 않도록 인스턴스 전용 사전을 사용합니다.
+        self._flyweights = {}
+        super().__init__(initial_flyweights, pool, verbose)
+
+    @property
+    def interner(self) -> KeyInterner:
+        return self._interner
+
+    def get_key(self, state: Sequence[str]) -> int:
+        """
+        주어진 상태에 대한 플라이웨이트의 정수 ID를 반환합니다.
+        """
+        return self._interner.intern(state)
+
+    def list_flyweights(self) -> None:
+        count = len(self._flyweights)
+        print(f"FlyweightFactory: {count}개의 플라이웨이트가 있습니다:")
+        print("\n".join("_".join(sorted(self._interner.state(key))) for key in self._flyweights.keys()), end="")
+
+    def flyweight_by_id(self, ident: int) -> Flyweight:
+        """
+        인턴된 ID로 플라이웨이트를 반환합니다. 풀에서 제거되었다면 다시 생성합니다.
+        풀의 적중/실패 통계가 정확하도록 풀은 한 번만 조회합니다.
+        """
+        flyweight = self._flyweights.get(ident)
+        if flyweight is None:
+            flyweight = self._create(ident, self._interner.state(ident))
+        return flyweight
+
+
+
+class ConcurrentFlyweightFactory(FlyweightFactory):
+    """
+    여러 스레드가 동시에 차량을 적재할 때 사용할 수 있는 팩토리입니다.
+
+    이미 있는 플라이웨이트를 읽을 때는 락을 잡지 않습니다. 사전의 단일 조회는 원자적이기 때문입니다.
+    플라이웨이트가 없을 때만 키의 해시로 고른 샤드 락을 잡고 다시 확인한 뒤 생성하므로,
+    같은 키에 대해 중복 생성이 없고 서로 다른 키를 만드는 스레드끼리는 하나의 락에 줄 서지 않습니다.
+    """
+
+    def __init__(self, initial_flyweights: Dict, shards: int = 16, verbose: bool = True) -> None:
+        if shards < 1:
+            raise ValueError("shards는 1 이상이어야 합니다.")
+        self._locks = [Lock() for _ in range(shards)]
+        self._flyweights = {}
+        self._created = [0] * shards
+        super().__init__(initial_flyweights, verbose=verbose)
+
+    @property
+    def created(self) -> int:
+        """
+        이 팩토리가 조회 중에 새로 생성한 플라이웨이트 수입니다. 샤드별로 락 안에서 셉니다.
+        """
+        return sum(self._created)
+
+    def get_flyweight(self, shared_state: Dict) -> Flyweight:
+        key = self.get_key(shared_state)
+
+        flyweight = self._flyweights.get(key)
+        if flyweight is None:
+            shard = hash(key) % len(self._locks)
+            with self._locks[shard]:
+                # 락을 기다리는 동안 다른 스레드가 이미 만들었을 수 있으므로 다시 확인합니다.
+                flyweight = self._flyweights.get(key)
+                if flyweight is None:
+                    self._log("FlyweightFactory: 플라이웨이트를 찾을 수 없습니다. 새로 생성 중")
+                    flyweight = Flyweight(shared_state)
+                    self._flyweights[key] = flyweight
+                    self._created[shard] += 1
+                    return flyweight
+
+        self._log("FlyweightFactory: 기존 플라이웨이트 재사용 중.")
+        return flyweight
+
+
+
+class CarStore:
+    """
+    경찰 데이터베이스의 외재 상태를 열(column) 단위로 보관하는 저장소입니다.
+
+    각 차량은 행 번호로만 존재하며, 플라이웨이트 ID는 정수 배열에, 번호판과 소유자는
+    각각 연속된 리스트에 저장됩니다. 차량마다 리스트나 객체를 만들지 않으므로
+    수백만 대를 한 번에 적재할 수 있고, 같은 플라이웨이트를 쓰는 연속 구간은 한 번에 처리됩니다.
+    """
+
+    def __init__(self, factory: InternedFlyweightFactory) -> None:
+        self._factory = factory
+        self.flyweight_ids = array("i")
+        self.plates: List[str] = []
+        self.owners: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.flyweight_ids)
+
+    def add(self, plates: str, owner: str, brand: str, model: str, color: str) -> int:
+        self.flyweight_ids.append(self._factory.get_key((brand, model, color)))
+        self.plates.append(plates)
+        self.owners.append(owner)
+        return len(self.flyweight_ids) - 1
+
+    def extend(self, cars: Iterable[Tuple[str, str, str, str, str]]) -> None:
+        """
+        (번호판, 소유자, 브랜드, 모델, 색상) 행들을 한 번에 적재합니다.
+        """
+        get_key = self._factory.get_key
+        ids = self.flyweight_ids
+        plates = self.plates
+        owners = self.owners
+        for plate, owner, brand, model, color in cars:
+            ids.append(get_key((brand, model, color)))
+            plates.append(plate)
+            owners.append(owner)
+
+    def operation(self, start: int = 0, stop: Optional[int] = None) -> None:
+        """
+        [start, stop) 구간의 차량을 플라이웨이트별 연속 구간으로 나누어 일괄 처리합니다.
+        """
+        if stop is None:
+            stop = len(self)
+        ids = self.flyweight_ids
+        run_start = start
+        while run_start < stop:
+            ident = ids[run_start]
+            run_stop = run_start + 1
+            while run_stop < stop and ids[run_stop] == ident:
+                run_stop += 1
+            # 슬라이스는 구간을 복사하므로 인덱스로 직접 꺼냅니다.
+            indices = range(run_start, run_stop)
+            self._factory.flyweight_by_id(ident).operation_batch(
+                zip(map(self.plates.__getitem__, indices), map(self.owners.__getitem__, indices))
+            )
+            run_start = run_stop
+
+
+
 def add_car_to_police_database(
         factory: FlyweightFactory, plates: str, owner: str,
         brand: str, model: str, color: str
@@ -69,6 +571,42 @@ def add_car_to_police_database(
 
 
 
+def add_cars_to_police_database(store: CarStore, cars: Iterable[Tuple[str, str, str, str, str]]) -> None:
+    """
+    `add_car_to_police_database`의 일괄 버전입니다. 외재 상태를 열 저장소에 적재합니다.
+    """
+    print("\n\n클라이언트: 경찰 데이터베이스에 차들을 일괄 추가 중입니다.")
+    store.extend(cars)
+
+
+
+def benchmark_lookups(calls: int = 1_000_000) -> Dict[str, float]:
+    """
+    문자열 키 팩토리와 인턴 팩토리의 초당 조회 수를 비교합니다.
+    """
+    cars = [
+        ("Chevrolet", "Camaro2018", "pink"),
+        ("Mercedes Benz", "C300", "black"),
+        ("Mercedes Benz", "C500", "red"),
+        ("BMW", "M5", "red"),
+        ("BMW", "X6", "white"),
+    ]
+    workload = [cars[i % len(cars)] for i in range(calls)]
+    results = {}
+    for factory in (
+            FlyweightFactory(cars, verbose=False),
+            InternedFlyweightFactory(cars, verbose=False),
+    ):
+        get_flyweight = factory.get_flyweight
+        start = time.perf_counter()
+        for car in workload:
+            get_flyweight(car)
+        elapsed = time.perf_counter() - start
+        results[type(factory).__name__] = calls / elapsed
+    return results
+
+
+
 if __name__ == "__main__":
     """
     클라이언트 코드는 보통 애플리케이션의 초기화 단계에서 미리 플라이웨이트를 여러 개 생성합니다.
@@ -87,7 +625,7 @@ if __name__ == "__main__":
     add_car_to_police_database(
         factory, "CL234IR", "James Doe", "BMW", "M5", "red"
     )
-    
+
     add_car_to_police_database(
         factory, "CL234IR", "James Doe", "BMW", "X1", "red"
     )
@@ -96,4 +634,46 @@ if __name__ == "__main__":
 
     factory.list_flyweights()
 
+    print("\n")
+
+    # 풀 모드에서는 용량을 넘으면 정책에 따라 플라이웨이트가 제거되고, 통계는 출력 없이 읽을 수 있습니다.
+    for policy in (LRUEviction(), LFUEviction()):
+        pooled = FlyweightFactory([], pool=FlyweightPool(capacity=2, policy=policy), verbose=False)
+        for car in (["BMW", "M5", "red"], ["BMW", "M5", "red"], ["BMW", "X6", "white"], ["Audi", "A4", "black"]):
+            pooled.get_flyweight(car)
+        print(f"\n{type(policy).__name__} 풀 통계: {pooled.stats.as_dict()}")
+        pooled.list_flyweights()
+
+    print("\n")
+
+    # 인턴 팩토리는 상태 순서가 달라도 같은 ID로 정규화합니다.
+    interned = InternedFlyweightFactory([["BMW", "M5", "red"]], verbose=False)
+    interned.get_flyweight(("red", "BMW", "M5"))
+    interned.list_flyweights()
+
+    store = CarStore(InternedFlyweightFactory([], verbose=False))
+    add_cars_to_police_database(store, [
+        ("CL234IR", "James Doe", "BMW", "M5", "red"),
+        ("CL235IR", "Jane Doe", "BMW", "M5", "red"),
+        ("AB100XY", "John Roe", "Audi", "A4", "black"),
+    ])
+    store.operation()
+
+    print("\n")
+
+    # 여러 스레드가 같은 차종을 동시에 적재해도 플라이웨이트는 차종마다 하나만 생성됩니다.
+    concurrent = ConcurrentFlyweightFactory([], verbose=False)
+    models = [["BMW", f"M{i}", "red"] for i in range(100)]
+    workers = [Thread(target=lambda: [concurrent.get_flyweight(m) for m in models]) for _ in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    print(f"ConcurrentFlyweightFactory: 8개 스레드가 {len(models)}개 차종을 적재하여 {concurrent.created}개 생성")
+
+    if "--bench" in sys.argv[1:]:
+        print("\n")
+        for name, rate in benchmark_lookups().items():
+            print(f"{name}: 초당 {rate:,.0f}회 조회")
+
 # python structural_pattern/flyweight.py